@@ -1,17 +1,63 @@
 import asyncpg
 import asyncio
 import json
+import orjson
 from typing import List, Dict, Any, Optional, Tuple
-from contextlib import asynccontextmanager
 import logging
 
 logger = logging.getLogger(__name__)
 
+
+def _encode_json(value: Any) -> bytes:
+    # Callers that already serialised the value keep passing JSON text/bytes
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        return value.encode()
+    return orjson.dumps(value)
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    return b'\x01' + _encode_json(value)  # jsonb binary format: version byte + JSON text
+
+
+async def register_json_codecs(conn: asyncpg.Connection):
+    """
+    Decode json/jsonb columns into Python objects with orjson inside asyncpg.
+    Parameters may be Python objects or already-serialised JSON str/bytes.
+    """
+    await conn.set_type_codec(
+        'jsonb',
+        encoder=_encode_jsonb,
+        decoder=lambda data: orjson.loads(data[1:]),
+        schema='pg_catalog',
+        format='binary'
+    )
+    await conn.set_type_codec(
+        'json',
+        encoder=_encode_json,
+        decoder=orjson.loads,
+        schema='pg_catalog',
+        format='binary'
+    )
+
+
 class AsyncPostgresClient:
-    def __init__(self, connection_string: str, pool_min: int = 10, pool_max: int = 20):
+    def __init__(
+        self,
+        connection_string: str,
+        pool_min: int = 10,
+        pool_max: int = 20,
+        init=None,
+        statement_cache_size: int = 1024
+    ):
         self.connection_string = connection_string
         self.pool_min = pool_min
         self.pool_max = pool_max
+        # Per-connection prepared statement cache; asyncpg's default of 100 is
+        # too small for the number of distinct queries the services issue.
+        self.statement_cache_size = statement_cache_size
+        self.init = init  # optional per-connection setup coroutine
         self.pool: Optional[asyncpg.Pool] = None
 
     async def initialize(self):
@@ -23,10 +69,12 @@ class AsyncPostgresClient:
                 max_size=self.pool_max,
                 # Optimizations for voice calling
                 command_timeout=10,  # 10 second timeout
+                statement_cache_size=self.statement_cache_size,
                 server_settings={
                     'application_name': 'voice_calling_system',
                     'jit': 'off'  # Disable JIT for more predictable latency
                 },
+                init=self.init,
             )
             logger.info("Async PostgreSQL connection pool created successfully")
         except Exception as e:
@@ -39,14 +87,16 @@ class AsyncPostgresClient:
             await self.pool.close()
             logger.info("PostgreSQL connection pool closed")
 
-    @asynccontextmanager
-    async def get_connection(self):
-        """Get a connection from the pool as an async context manager"""
+    def get_connection(self):
+        """
+        Get a connection from the pool as an async context manager. This is
+        the pool's own acquire context, so no generator-based wrapper is set
+        up and torn down around every checkout.
+        """
         if not self.pool:
             raise RuntimeError("Connection pool not initialized. Call initialize() first.")
         
-        async with self.pool.acquire() as connection:
-            yield connection
+        return self.pool.acquire()
 
     async def execute_query(
         self, 
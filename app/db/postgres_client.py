@@ -1,7 +1,7 @@
 import os
 import asyncio
 from typing import Optional
-from app.db.postgres import AsyncPostgresClient
+from app.db.postgres import AsyncPostgresClient, register_json_codecs
 from config import config
 import logging
 
@@ -11,6 +11,8 @@ class DatabaseClient:
     _instance = None
     _client: Optional[AsyncPostgresClient] = None
     _initialized = False
+    _json_client: Optional[AsyncPostgresClient] = None
+    _json_initialized = False
     
     def __new__(cls):
         if cls._instance is None:
@@ -27,6 +29,15 @@ class DatabaseClient:
                 pool_min=10,  # Higher min for voice calls
                 pool_max=50   # Higher max for concurrent calls
             )
+            # Separate, smaller pool whose connections decode json/jsonb
+            # columns natively. Kept apart so existing code reading JSON text
+            # from the main pool is unaffected.
+            self._json_client = AsyncPostgresClient(
+                connection_string=app_config.DATABASE_URL,
+                pool_min=2,
+                pool_max=20,
+                init=register_json_codecs
+            )
     
     async def initialize(self):
         """Initialize the async connection pool"""
@@ -42,10 +53,20 @@ class DatabaseClient:
             logger.warning("Database accessed before initialization. This is okay during import time.")
         return self._client
     
+    async def initialize_json(self):
+        """Initialize the JSON-decoding connection pool"""
+        if not self._json_initialized:
+            await self._json_client.initialize()
+            self._json_initialized = True
+            logger.info("JSON-decoding database pool initialized")
+
     async def close(self):
         if self._client and self._initialized:
             await self._client.close()
             self._initialized = False
+        if self._json_client and self._json_initialized:
+            await self._json_client.close()
+            self._json_initialized = False
 
 # Create the singleton instance
 postgres_client = DatabaseClient()
@@ -56,3 +77,12 @@ async def get_db_connection():
     if not postgres_client._initialized:
         await postgres_client.initialize()
     return postgres_client.client.get_connection()
+
+async def get_json_db_connection():
+    """
+    Get a connection (async context manager) on which json/jsonb columns are
+    returned as Python objects instead of JSON text.
+    """
+    if not postgres_client._json_initialized:
+        await postgres_client.initialize_json()
+    return postgres_client._json_client.get_connection()
@@ -6,6 +6,7 @@ from routes.company import router as company_router
 #from routes.conversation import conversation_router
 #from routes.customer import customer_router
 from app.services.analytics_realtime_service import analytics_realtime_service
+from app.services.campaign_dial_worker import campaign_dial_worker
 from routes.email import router as email_router
 from routes.invitation import router as invitation_router
 from routes.s3 import router as s3_router
@@ -62,6 +63,7 @@ async def lifespan(app: FastAPI):
     try:
         # Initialize database connection pool
         await postgres_client.initialize()
+        await postgres_client.initialize_json()
         logger.info("Database connection pool initialized")
         
         # Check database connectivity
@@ -75,6 +77,12 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Analytics real-time service failed to start: {e}")
             # Don't fail the entire app if analytics service fails
+
+        # Start campaign dial queue worker
+        try:
+            await campaign_dial_worker.start()
+        except Exception as e:
+            logger.error(f"Campaign dial worker failed to start: {e}")
         
         # # Start AgentNumber Real-time Service
         # try:
@@ -101,6 +109,12 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error stopping agent number service: {e}")
         
+        # Stop campaign dial queue worker
+        try:
+            await campaign_dial_worker.stop()
+        except Exception as e:
+            logger.error(f"Error stopping campaign dial worker: {e}")
+        
         # Stop Analytics Real-time Service
         try:
             await analytics_realtime_service.stop()
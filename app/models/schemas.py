@@ -5,6 +5,9 @@ from datetime import datetime, time, date
 import re
 from enum import Enum
 
+# WhatsApp recipients: + followed by 10-15 digits
+_E164_PHONE_RE = re.compile(r'^\+\d{10,15}$')
+
 class IntegrationType(str, Enum):
     WHATSAPP = "whatsapp"
     GOOGLE = "google" 
@@ -506,7 +509,7 @@ class WhatsAppMessageRequest(BaseModel):
         
         # Basic phone number validation
         # Should start with + and contain 10-15 digits
-        if not re.match(r'^\+\d{10,15}$', v):
+        if not _E164_PHONE_RE.match(v):
             # Try to fix common formats
             if v.startswith('00'):
                 v = '+' + v[2:]
@@ -560,7 +563,7 @@ class WhatsAppTemplateMessage(BaseModel):
     @classmethod  # <- ADD @classmethod decorator
     def validate_phone_number(cls, v: str) -> str:  # <- Use 'cls' not 'self'
         v = v.strip()
-        if not re.match(r'^\+\d{10,15}$', v):
+        if not _E164_PHONE_RE.match(v):
             if v.startswith('00'):
                 v = '+' + v[2:]
             elif not v.startswith('+') and v.isdigit():
@@ -583,7 +586,7 @@ class WhatsAppMediaMessage(BaseModel):
     @classmethod
     def validate_phone_number(cls, v: str) -> str:
         v = v.strip()
-        if not re.match(r'^\+\d{10,15}$', v):
+        if not _E164_PHONE_RE.match(v):
             if v.startswith('00'):
                 v = '+' + v[2:]
             elif not v.startswith('+') and v.isdigit():
@@ -614,7 +617,7 @@ class BulkMessageRequest(BaseModel):
         validated_numbers = []
         for phone in v:
             phone = phone.strip()
-            if not re.match(r'^\+\d{10,15}$', phone):
+            if not _E164_PHONE_RE.match(phone):
                 if phone.startswith('00'):
                     phone = '+' + phone[2:]
                 elif not phone.startswith('+') and phone.isdigit():
@@ -249,16 +249,17 @@ class BookingService:
         values.append(datetime.utcnow())
         param_count += 1
 
-        placeholders = ', '.join(f'${i}' for i in range(param_count, param_count + len(bulk_update.booking_ids)))
-        values.extend(bulk_update.booking_ids)
+        # One array parameter instead of a placeholder per id, so the
+        # statement no longer grows with the number of bookings.
+        values.append(list(bulk_update.booking_ids))
         values.append(company_id)
         
         query = f"""
             UPDATE booking 
             SET {', '.join(update_fields)}
-            WHERE id IN ({placeholders})
+            WHERE id = ANY(${param_count}::text[])
             AND campaign_id IN (
-                SELECT id FROM Campaign WHERE company_id = ${len(values)}
+                SELECT id FROM Campaign WHERE company_id = ${param_count + 1}
             )
         """
         
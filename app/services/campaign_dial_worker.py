@@ -0,0 +1,172 @@
+import asyncio
+import logging
+from typing import Dict, List, Tuple
+
+from app.services.campaign_service import (
+    CALL_API_MAX_RETRIES,
+    CALL_API_RETRY_DELAY,
+    CALL_API_TIMEOUT,
+    CampaignService,
+    _build_dial_context,
+    _dial_lead_once,
+)
+
+logger = logging.getLogger(__name__)
+
+DIAL_QUEUE_BATCH_SIZE = 50
+DIAL_QUEUE_POLL_INTERVAL = 5.0  # seconds to idle when nothing is due
+# Back-off for a campaign's claimed rows when its dial context can't be built
+# (database error, agent number lookup failure); no attempt is consumed.
+DIAL_QUEUE_RETRY_DELAY_SECONDS = 60
+# A claimed row stays invisible to other workers for this long. Rows wait in
+# memory until a dial slot frees up, so the lock is renewed right before each
+# dial and only has to cover one outbound API call: every attempt running into
+# its connect/write/read timeouts, the backoff between attempts (see
+# _make_outbound_call_request) and a minute for the surrounding queries.
+DIAL_QUEUE_LOCK_SECONDS = int(
+    CALL_API_MAX_RETRIES * (CALL_API_TIMEOUT.connect + CALL_API_TIMEOUT.write + CALL_API_TIMEOUT.read)
+    + sum(CALL_API_RETRY_DELAY * 1.5 ** i for i in range(CALL_API_MAX_RETRIES - 1))
+    + 60
+)
+
+
+class CampaignDialWorker:
+    """Background worker that drains campaign_dial_queue and schedules retries"""
+
+    def __init__(self):
+        self.svc = CampaignService()
+        self.worker_task: asyncio.Task = None
+
+    async def start(self):
+        """Start polling the dial queue"""
+        if self.worker_task and not self.worker_task.done():
+            return
+        self.worker_task = asyncio.create_task(self._run())
+        logger.info("Campaign dial worker started")
+
+    async def stop(self):
+        """Stop polling; claimed rows are released when their lock expires"""
+        if self.worker_task:
+            self.worker_task.cancel()
+            try:
+                await self.worker_task
+            except asyncio.CancelledError:
+                pass
+            self.worker_task = None
+            logger.info("Campaign dial worker stopped")
+
+    async def _run(self):
+        while True:
+            try:
+                processed = await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"[dial-worker] Error processing dial queue: {e}")
+                processed = 0
+
+            if not processed:
+                await asyncio.sleep(DIAL_QUEUE_POLL_INTERVAL)
+
+    async def run_once(self) -> int:
+        """Claim one batch of due rows and process it; returns the batch size"""
+        rows = await self.svc.claim_due_dials(DIAL_QUEUE_BATCH_SIZE, DIAL_QUEUE_LOCK_SECONDS)
+        if not rows:
+            return 0
+
+        by_campaign: Dict[Tuple[str, str], List[Dict]] = {}
+        for row in rows:
+            by_campaign.setdefault((row["campaign_id"], row["company_id"]), []).append(row)
+
+        async with asyncio.TaskGroup() as tg:
+            for (campaign_id, company_id), campaign_rows in by_campaign.items():
+                tg.create_task(self._process_campaign_rows(campaign_id, company_id, campaign_rows))
+
+        return len(rows)
+
+    async def _process_campaign_rows(self, campaign_id: str, company_id: str, rows: List[Dict]):
+        """
+        Dial one campaign's share of the batch with a pool of
+        max_concurrent_calls workers pulling from a queue, so concurrency is
+        bounded by the pool size rather than by tasks waiting on a semaphore.
+        """
+        try:
+            try:
+                ctx = await _build_dial_context(self.svc, campaign_id, company_id)
+            except Exception as e:
+                logger.warning(
+                    f"[dial-worker] Deferring {len(rows)} queued leads for campaign {campaign_id}: {e}"
+                )
+                await self.svc.defer_dials([row["id"] for row in rows], DIAL_QUEUE_RETRY_DELAY_SECONDS)
+                return
+            if ctx is None:
+                # Only returned once the campaign is confirmed deleted
+                logger.error(f"[dial-worker] Dropping {len(rows)} queued leads for campaign {campaign_id}")
+                for row in rows:
+                    await self.svc.complete_dial(row["id"])
+                return
+
+            queue: asyncio.Queue = asyncio.Queue()
+            for row in rows:
+                queue.put_nowait(row)
+
+            async with asyncio.TaskGroup() as tg:
+                for _ in range(min(ctx["max_concurrent_calls"], len(rows))):
+                    tg.create_task(self._drain(queue, ctx))
+
+            await self.svc._initiate_lead_calls(campaign_id, ctx["lead_call_writes"])
+        except Exception as e:
+            logger.exception(f"[dial-worker] Error dialing queued leads for campaign {campaign_id}: {e}")
+
+    async def _drain(self, queue: asyncio.Queue, ctx: Dict):
+        while not queue.empty():
+            row = queue.get_nowait()
+            try:
+                await self._process_row(row, ctx)
+            except Exception as e:
+                logger.exception(f"[dial-worker] Error dialing queued lead {row['lead_id']}: {e}")
+
+    async def _process_row(self, row: Dict, ctx: Dict):
+        lead_id = row["lead_id"]
+
+        # The row may have sat in the queue past its claim; only dial it if
+        # the claim still holds, and restart the lock window for this dial.
+        locked_until = await self.svc.renew_dial_lock(row["id"], row["locked_until"], DIAL_QUEUE_LOCK_SECONDS)
+        if locked_until is None:
+            logger.info("[dial-worker] Lost claim on queued lead %s; leaving it to the worker that re-claimed it", lead_id)
+            return
+        last_call_sid = row["last_call_sid"]
+
+        if last_call_sid:
+            call_table_status = await self.svc.get_call_status_by_sid(last_call_sid)
+            logger.info("[activate] Call table status for sid=%s -> %s (lead=%s)", last_call_sid, call_table_status, lead_id)
+            if call_table_status != "no-answer":
+                logger.info("[activate] Terminal/answered status for lead %s: %s — no retry", lead_id, call_table_status)
+                await self.svc.complete_dial(row["id"])
+                return
+
+        if row["attempts_left"] <= 0:
+            logger.info("[activate] No remaining attempts for lead %s; stop retrying", lead_id)
+            await self.svc.complete_dial(row["id"])
+            return
+
+        lead = {
+            "id": lead_id,
+            "phone": row["phone"],
+            "country_code": row["country_code"],
+            "to_number": row["to_number"],
+            "first_name": row["first_name"],
+        }
+        res = await _dial_lead_once(self.svc, lead, ctx)
+        call_sid = res.get("call_sid")
+
+        if not call_sid and row["attempts_left"] <= 1:
+            logger.info("[activate] Exhausted attempts for lead %s without call_sid", lead_id)
+            await self.svc.complete_dial(row["id"])
+            return
+
+        await self.svc.reschedule_dial(row["id"], call_sid, ctx["call_interval_minutes"])
+
+
+# Global instance
+campaign_dial_worker = CampaignDialWorker()
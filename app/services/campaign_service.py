@@ -1,12 +1,13 @@
 # app/services/campaign_service.py
+import os
 import uuid
-import json
 import csv
 import io
 import re
-from typing import List, Dict, Any, Optional
+from itertools import islice
+from typing import List, Dict, Any, Optional, Iterable, Iterator, AsyncIterator, Tuple
 from datetime import datetime
-from app.db.postgres_client import get_db_connection
+from app.db.postgres_client import get_db_connection, get_json_db_connection
 from app.models.campaigns import (
     CreateCampaignRequest, CampaignResponse, CampaignLead,
     DataMapping, CalendarBooking, AutomationSettings, UpdateCampaignRequest, 
@@ -18,8 +19,6 @@ from app.models.schemas import (
     BookingSettingsUpdate, EmailSettingsUpdate, CallSettingsUpdate, ScheduleSettingsUpdate
 )
 from app.models.schemas import CallInitiateRequest, CallStatusResponse
-from datetime import datetime, date
-from app.models.schemas import AgentUpdate
 import logging
 from app.models.schemas import LeadCreate, LeadUpdate, Lead, LeadsBulkUpdate
 from app.models.schemas import (
@@ -27,8 +26,12 @@ from app.models.schemas import (
     CSVValidationError, CSVMapFieldsRequest, CSVMapFieldsResponse, FieldMapping
 )
 import asyncio
+from asyncpg import Record
 import httpx
+import orjson
+from pydantic import TypeAdapter
 from app.db.queries.activity_queries import ActivityQueries
+from app.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -44,31 +47,442 @@ CALL_API_TIMEOUT = httpx.Timeout(
 CALL_API_MAX_RETRIES = 3
 CALL_API_RETRY_DELAY = 2.0  # seconds between retries
 
+# The shared pool's 10s command_timeout also applies to COPY, which is too
+# short for large lead CSVs.
+LEAD_COPY_TIMEOUT = 300.0
+# import_leads_csv and import_leads_csv_v2 load uploads in pages of this many
+# rows, so only one page of lead data is held in memory (and each bulk
+# statement stays well inside LEAD_COPY_TIMEOUT) at a time.
+LEAD_IMPORT_PAGE_SIZE = 10_000
+
+_NON_DIGIT_RE = re.compile(r'\D')
+EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+PHONE_RE = re.compile(r'^[\+]?[1-9]?[\d\s\-\(\)]{7,15}$')
+# CSV field transforms by name (see map_csv_fields)
+_TRANSFORMS = {
+    "upper": str.upper,
+    "lower": str.lower,
+    "trim": str.strip,
+    "title": str.title,
+}
+
+
+def _dumps(obj: Any) -> str:
+    """orjson-encode to str, the form asyncpg expects for json/jsonb parameters"""
+    return orjson.dumps(obj).decode()
+
+# Serialises data_mapping lists straight to JSON without a list-of-dicts copy
+_DATA_MAPPING_LIST = TypeAdapter(List[DataMapping])
+
+# The Campaign columns and data_mapping entries are typed by the table and
+# validated on write, so responses built from rows skip pydantic validation
+# for them. The booking/automation settings JSON is still validated (see
+# _to_campaign_response).
+_DATA_MAPPING_CONSTRUCT = DataMapping.model_construct
+_CAMPAIGN_RESPONSE_CONSTRUCT = CampaignResponse.model_construct
+
+LEAD_CORE_FIELDS = ('first_name', 'last_name', 'email', 'phone', 'company', 'country_code')
+_LEAD_CORE_FIELD_SET = frozenset(LEAD_CORE_FIELDS)
+
+# Columns COPY'd into campaign_lead_staging. Custom fields travel as a text[]
+# of values aligned with the upload's custom field names; Postgres assembles
+# the custom_fields JSONB when the staged rows are moved into campaign_lead.
+CAMPAIGN_LEAD_COPY_COLUMNS = [
+    'id', 'campaign_id', 'first_name', 'last_name', 'email', 'phone', 'company',
+    'custom_values', 'call_attempts', 'last_call_at', 'status',
+    'created_at', 'updated_at', 'country_code', 'to_number',
+]
+_CAMPAIGN_LEAD_INSERT_COLUMNS = ', '.join(
+    'custom_fields' if col == 'custom_values' else col for col in CAMPAIGN_LEAD_COPY_COLUMNS
+)
+# Empty CSV cells are staged as NULL and dropped by jsonb_strip_nulls
+_CAMPAIGN_LEAD_STAGING_SELECT = ', '.join(
+    'jsonb_strip_nulls(jsonb_object($1::text[], custom_values))' if col == 'custom_values' else col
+    for col in CAMPAIGN_LEAD_COPY_COLUMNS
+)
+
+
+# Columns of the leads CSV export (get_all_leads)
+LEAD_EXPORT_COLUMNS = (
+    'id', 'first_name', 'last_name', 'email', 'phone', 'company', 'status', 'call_attempts',
+)
+
+# Columns import_leads_csv_v2 maps onto lead fields; the rest become custom fields
+_STANDARD_LEAD_FIELDS = frozenset({'email', 'first_name', 'last_name', 'phone', 'company'})
+
+# CSV columns import_leads_csv reads for the campaign lead and master lead rows
+IMPORT_LEAD_COLUMNS = (
+    'email', 'first_name', 'last_name', 'phone', 'company', 'lead_company',
+    'country_code', 'custom_fields', 'source',
+)
+
+# Master lead upkeep for a whole import page, in three statements instead of a
+# lookup/insert/link per row. Rows are matched on LOWER(email); the first row
+# per email wins.
+_IMPORT_FILL_LEADS_SQL = """
+    UPDATE leads AS l SET
+        first_name = CASE WHEN COALESCE(l.first_name, '') = '' AND i.first_name <> ''
+                          THEN i.first_name ELSE l.first_name END,
+        last_name = CASE WHEN COALESCE(l.last_name, '') = '' AND i.last_name <> ''
+                         THEN i.last_name ELSE l.last_name END,
+        phone = CASE WHEN COALESCE(l.phone, '') = '' AND i.phone <> ''
+                     THEN i.phone ELSE l.phone END,
+        lead_company = CASE WHEN COALESCE(l.lead_company, '') = '' AND i.lead_company <> ''
+                            THEN i.lead_company ELSE l.lead_company END,
+        updated_at = CURRENT_TIMESTAMP
+    FROM (
+        SELECT DISTINCT ON (email) *
+        FROM unnest($2::text[], $3::text[], $4::text[], $5::text[], $6::text[])
+             WITH ORDINALITY AS t(email, first_name, last_name, phone, lead_company, ord)
+        ORDER BY email, ord
+    ) AS i
+    WHERE l.company_id = $1 AND LOWER(l.email) = i.email
+      AND (   (COALESCE(l.first_name, '') = '' AND i.first_name <> '')
+           OR (COALESCE(l.last_name, '') = '' AND i.last_name <> '')
+           OR (COALESCE(l.phone, '') = '' AND i.phone <> '')
+           OR (COALESCE(l.lead_company, '') = '' AND i.lead_company <> ''))
+"""
+_IMPORT_INSERT_LEADS_SQL = """
+    INSERT INTO leads (
+        company_id, email, first_name, last_name, phone, lead_company,
+        custom_fields, source, created_at, updated_at
+    )
+    SELECT $1, i.email, i.first_name, i.last_name, i.phone, i.company,
+           COALESCE(to_jsonb(i.custom_fields), '{}'::jsonb), i.source, $9, $9
+    FROM (
+        SELECT DISTINCT ON (email) *
+        FROM unnest($2::text[], $3::text[], $4::text[], $5::text[], $6::text[], $7::text[], $8::text[])
+             WITH ORDINALITY AS t(email, first_name, last_name, phone, company, custom_fields, source, ord)
+        ORDER BY email, ord
+    ) AS i
+    WHERE NOT EXISTS (
+        SELECT 1 FROM leads l WHERE l.company_id = $1 AND LOWER(l.email) = i.email
+    )
+    ON CONFLICT (company_id, email) DO NOTHING
+"""
+_IMPORT_LINK_LEADS_SQL = """
+    INSERT INTO campaign_leads (
+        campaign_id, lead_id, campaign_status,
+        campaign_custom_fields, added_to_campaign_at
+    )
+    SELECT $1, l.id, 'pending', '{}'::jsonb, $4
+    FROM leads l
+    WHERE l.company_id = $2 AND LOWER(l.email) = ANY($3::text[])
+    ON CONFLICT (campaign_id, lead_id) DO NOTHING
+"""
+# import_leads_csv_v2 variants: custom fields arrive as JSON objects and are
+# copied onto the campaign association too.
+_IMPORT_V2_INSERT_LEADS_SQL = """
+    INSERT INTO leads (
+        company_id, email, first_name, last_name, phone, lead_company,
+        custom_fields, source, created_at, updated_at
+    )
+    SELECT $1, i.email, i.first_name, i.last_name, i.phone, i.company,
+           i.custom_fields::jsonb, 'csv_import', $8, $8
+    FROM (
+        SELECT DISTINCT ON (email) *
+        FROM unnest($2::text[], $3::text[], $4::text[], $5::text[], $6::text[], $7::text[])
+             WITH ORDINALITY AS t(email, first_name, last_name, phone, company, custom_fields, ord)
+        ORDER BY email, ord
+    ) AS i
+    WHERE NOT EXISTS (
+        SELECT 1 FROM leads l WHERE l.company_id = $1 AND LOWER(l.email) = i.email
+    )
+    ON CONFLICT (company_id, email) DO NOTHING
+"""
+_IMPORT_V2_LINK_LEADS_SQL = """
+    INSERT INTO campaign_leads (
+        campaign_id, lead_id, campaign_status,
+        campaign_custom_fields, added_to_campaign_at
+    )
+    SELECT $1, l.id, 'pending', i.custom_fields::jsonb, $5
+    FROM (
+        SELECT DISTINCT ON (email) *
+        FROM unnest($3::text[], $4::text[]) WITH ORDINALITY AS t(email, custom_fields, ord)
+        ORDER BY email, ord
+    ) AS i
+    JOIN leads l ON l.company_id = $2 AND LOWER(l.email) = i.email
+    ON CONFLICT (campaign_id, lead_id) DO NOTHING
+"""
+
+
+def _csv_lines(csv_content: "str | Iterable[str]") -> Iterable[str]:
+    """
+    CSV input for csv.reader: an in-memory string, or any iterable of lines
+    (e.g. a text wrapper over the uploaded file) so large uploads are parsed
+    without being held in memory as one string.
+    """
+    return io.StringIO(csv_content) if isinstance(csv_content, str) else csv_content
+
+
+def _split_lead_mapping(data_mapping: List[DataMapping]) -> Tuple[list, list]:
+    """(csv_column, field) pairs for the core lead fields and for custom fields"""
+    column_mapping = {mapping.csv_column: mapping.mapped_to for mapping in data_mapping}
+    core_columns = [(col, field) for col, field in column_mapping.items() if field in _LEAD_CORE_FIELD_SET]
+    custom_columns = [(col, field) for col, field in column_mapping.items() if field not in _LEAD_CORE_FIELD_SET]
+    return core_columns, custom_columns
+
+
+def _normalize_to_number(phone: str | None, country_code: str | None) -> str | None:
+    """Build the E.164-style number we dial from a lead's raw phone and country code"""
+    phone_raw = (phone or "").strip()
+    if not phone_raw:
+        return None
+
+    phone_digits = _NON_DIGIT_RE.sub('', phone_raw)
+    cc_digits = _NON_DIGIT_RE.sub('', str(country_code or "").strip())
+    if phone_digits.startswith("0") and cc_digits:
+        phone_digits = phone_digits.lstrip("0")
+
+    if cc_digits:
+        return f"+{cc_digits}{phone_digits}"
+    return f"+{phone_digits}" if not phone_raw.startswith("+") else phone_raw
+
+
+LEAD_ID_BATCH_SIZE = 1024
+
+
+def _iter_lead_ids() -> Iterator[str]:
+    """
+    Endless stream of LEAD-XXXXXXXX ids (same shape as the uuid4-based ones),
+    drawing random bytes for LEAD_ID_BATCH_SIZE ids per os.urandom call.
+    """
+    while True:
+        rand = os.urandom(4 * LEAD_ID_BATCH_SIZE).hex().upper()
+        for i in range(0, len(rand), 8):
+            yield f"LEAD-{rand[i:i + 8]}"
+
+
+# Static statement text, so asyncpg's per-connection statement cache parses and
+# plans it once per pooled connection. (conn.prepare() bypasses that cache and
+# would re-parse on every call.)
+_ADD_LEAD_SQL = """
+    INSERT INTO Campaign_Lead 
+    (id, campaign_id, first_name, last_name, email, phone, company, custom_fields, created_at, updated_at)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+    RETURNING *
+"""
+
+_CAMPAIGN_LEADS_V2_SELECT = """
+    SELECT 
+        l.*,
+        cl.campaign_status,
+        cl.call_attempts,
+        cl.last_call_at,
+        cl.email_attempts,
+        cl.campaign_custom_fields,
+        cl.added_to_campaign_at
+    FROM campaign_leads cl
+    JOIN leads l ON l.id = cl.lead_id
+"""
+
+# Lead updates come in a handful of shapes (the set of LeadUpdate fields sent),
+# so their SET clauses are built once per shape. Keys are field-name tuples in
+# binding order, since the parameter numbering depends on it.
+_LEAD_SET_CLAUSE_CACHE: Dict[tuple, str] = {}
+_LEAD_UPDATE_SQL_CACHE: Dict[tuple, str] = {}
+_LEAD_BULK_UPDATE_SQL_CACHE: Dict[tuple, str] = {}
+
+# update_calling_progress is called with the same few keyword shapes; caching
+# the statement per shape keeps its text identical, so the connection's
+# statement cache reuses one prepared statement per shape.
+_CALLING_PROGRESS_FIELDS = frozenset({
+    'current_lead', 'total_leads', 'successful_calls', 'failed_calls', 'progress_percentage', 'completed',
+})
+_CALLING_PROGRESS_SQL_CACHE: Dict[tuple, str] = {}
+
+
+def _lead_set_clause(fields: tuple) -> str:
+    """SET clause updating the given Campaign_Lead fields, bound as $1..$n"""
+    clause = _LEAD_SET_CLAUSE_CACHE.get(fields)
+    if clause is None:
+        parts = [
+            f"{field} = ${i}::jsonb" if field == 'custom_fields' else f"{field} = ${i}"
+            for i, field in enumerate(fields, 1)
+        ]
+        parts.append("updated_at = CURRENT_TIMESTAMP")
+        clause = _LEAD_SET_CLAUSE_CACHE[fields] = ', '.join(parts)
+    return clause
+
+
+def _lead_update_values(updates: Dict[str, Any]) -> list:
+    return [_dumps(value) if field == 'custom_fields' else value for field, value in updates.items()]
+
+
+_COMPANY_CAMPAIGNS_SELECT = """
+SELECT
+    c.id, c.agent_id, a.name AS agent_name,
+    c.campaign_name, c.description, c.company_id, c.created_by,
+    c.status, c.leads_count, c.csv_file_path, c.leads_file_url,
+    c.data_mapping, c.booking_config, c.automation_config,
+    c.created_at, c.updated_at
+FROM Campaign c
+LEFT JOIN "Agent" a
+    ON a.id = c.agent_id
+WHERE c.company_id = $1
+"""
+
+# id breaks created_at ties so the order is stable for keyset pagination; both
+# queries are served by idx_campaign_company_created (see
+# scripts/add_campaign_keyset_indexes.py).
+COMPANY_CAMPAIGNS_QUERY = _COMPANY_CAMPAIGNS_SELECT + """\
+ORDER BY c.created_at DESC, c.id DESC
+"""
+
+COMPANY_CAMPAIGNS_BEFORE_QUERY = _COMPANY_CAMPAIGNS_SELECT + """\
+AND (c.created_at, c.id) < ($2, $3)
+ORDER BY c.created_at DESC, c.id DESC
+LIMIT $4
+"""
+# Rows per query when iter_campaigns_by_company streams a company's campaigns
+CAMPAIGN_STREAM_PAGE_SIZE = 100
+
+# Campaign reads are cached per process for a short time. Writes made through
+# CampaignService invalidate this instance's entries immediately; other
+# instances see the change once the TTL expires.
+_campaign_cache = TTLCache(maxsize=1024, ttl=30)
+_company_campaigns_cache = TTLCache(maxsize=256, ttl=30)
+_campaign_settings_cache = TTLCache(maxsize=1024, ttl=30)
+# Calling dashboards poll these every second or so; a 2s TTL collapses the
+# polls from all open tabs into one query per window.
+_calling_status_cache = TTLCache(maxsize=1024, ttl=2)
+_lead_counts_cache = TTLCache(maxsize=1024, ttl=2)
+
+# Defaults for settings missing from the stored JSON. Mutable values are not
+# shared from here: settings models built with model_construct keep whatever
+# object they are given, so _apply_*_defaults creates those per call.
+_BOOKING_DEFAULTS = {
+    "calendar_type": "google",
+    "meeting_duration_minutes": 30,
+    "buffer_time_minutes": 15,
+    "send_invite_to_lead": True,
+    "send_invite_to_team": True,
+    "booking_window_days": 30,
+    "min_notice_hours": 2,
+    "max_bookings_per_day": None
+}
+_EMAIL_DEFAULTS = {
+    "template": "Hi {{first_name}}, let's connect!",
+    "subject_line": "Quick chat about your business needs",
+    "from_name": "Sales Team",
+    "from_email": "support@callsure.co.in",
+    "enable_followup": True,
+    "followup_delay_hours": 24,
+    "max_followup_attempts": 3,
+    "unsubscribe_link": True,
+    "track_opens": True,
+    "track_clicks": True
+}
+_PREFERRED_CALLING_HOURS = {
+    "start": "09:00",
+    "end": "17:00", 
+    "timezone": "UTC"
+}
+_CALL_DEFAULTS = {
+    "script": "Hello {{first_name}}, this is {{agent_name}} calling about...",
+    "max_call_attempts": 3,
+    "call_interval_hours": 24,
+    "voicemail_script": None,
+    "call_recording_enabled": True,
+    "auto_dial_enabled": False,
+    "caller_id": None
+}
+# Schedule settings are validated, which copies the day lists
+_SCHEDULE_DEFAULTS = {
+    "working_days": ["monday", "tuesday", "wednesday", "thursday", "friday"],
+    "working_hours_start": "09:00:00",
+    "working_hours_end": "17:00:00",
+    "timezone": "UTC",
+    "lunch_break_start": "12:00:00",
+    "lunch_break_end": "13:00:00",
+    "max_concurrent_calls": 5,
+    "campaign_active_days": ["monday", "tuesday", "wednesday", "thursday", "friday"],
+    "pause_on_holidays": True
+}
+
+# update_*_settings merge the partial update into the stored JSON server-side
+# and read the result back in the same statement, instead of fetching the
+# settings first. Email/call/schedule fall back to the legacy copy nested in
+# automation_config, matching _fetch_campaign_settings.
+_SETTINGS_PATCH_SQL = {
+    column: f"""
+        UPDATE Campaign
+        SET {column} = COALESCE({column}::jsonb, {fallback}'{{}}'::jsonb) || $1::jsonb,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = $2 AND company_id = $3
+        RETURNING {column}
+    """
+    for column, fallback in (
+        ('booking_config', ''),
+        ('email_settings', "automation_config::jsonb -> 'email', "),
+        ('call_settings', "automation_config::jsonb -> 'call', "),
+        ('schedule_settings', "automation_config::jsonb -> 'schedule', "),
+    )
+}
+
+
+class _CountingIterator:
+    """Wraps an iterable and counts the items pulled through it (e.g. by COPY)"""
+
+    def __init__(self, iterable: Iterable):
+        self._it = iter(iterable)
+        self.count = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        item = next(self._it)
+        self.count += 1
+        return item
+
 
 class CampaignService:
     def __init__(self):
         self.activity_queries = ActivityQueries()
         pass
 
-    def _to_campaign_response(self, row: dict) -> CampaignResponse:
-        raw_mapping = row.pop("data_mapping", "[]")
-        if isinstance(raw_mapping, str):
-            raw_mapping = json.loads(raw_mapping)
-        row["data_mapping"] = [DataMapping(**m) for m in raw_mapping]
+    def _invalidate_campaign_cache(self, campaign_id: str, company_id: str) -> None:
+        _campaign_cache.pop((campaign_id, company_id))
+        _campaign_settings_cache.pop((campaign_id, company_id))
+        _company_campaigns_cache.pop_where(lambda key: key[0] == company_id)
 
-        raw_booking = row.pop("booking_config", "{}")
-        if isinstance(raw_booking, str):
-            raw_booking = json.loads(raw_booking)
-        row["booking"] = CalendarBooking(**raw_booking)
-
-        raw_auto = row.pop("automation_config", "{}")
-        if isinstance(raw_auto, str):
-            raw_auto = json.loads(raw_auto)
-        row["automation"] = AutomationSettings(**raw_auto)
-
-        row["agent_id"] = row.get("agent_id")
-
-        return CampaignResponse(**row)
+    def _to_campaign_response(
+        self,
+        row,
+        _campaign=_CAMPAIGN_RESPONSE_CONSTRUCT,
+        _mapping=_DATA_MAPPING_CONSTRUCT,
+        _booking=CalendarBooking,
+        _automation=AutomationSettings,
+    ) -> CampaignResponse:
+        # Accepts an asyncpg Record or a dict; fields are read by key so the
+        # row never has to be copied into an intermediate dict. Only use this
+        # for rows read back from the database (see _CAMPAIGN_RESPONSE_CONSTRUCT)
+        # over get_json_db_connection(), whose codec already decoded the JSONB.
+        # The constructors are bound as defaults because list endpoints call
+        # this once per row; never pass them explicitly. Booking and
+        # automation settings are validated, so legacy or hand-edited JSON is
+        # coerced (or rejected) rather than passed through as stored.
+        get = row.get
+
+        return _campaign(
+            id=row["id"],
+            agent_id=get("agent_id"),
+            agent_name=get("agent_name"),
+            campaign_name=row["campaign_name"],
+            description=get("description"),
+            company_id=row["company_id"],
+            created_by=row["created_by"],
+            status=row["status"],
+            leads_count=row["leads_count"],
+            csv_file_path=get("csv_file_path"),
+            leads_file_url=get("leads_file_url"),
+            data_mapping=[_mapping(**m) for m in get("data_mapping") or ()],
+            booking=_booking(**(get("booking_config") or {})),
+            automation=_automation(**(get("automation_config") or {})),
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
 
 
     async def create_campaign(
@@ -76,17 +490,15 @@ class CampaignService:
         campaign_request: CreateCampaignRequest,
         company_id: str,
         created_by: str,
-        csv_content: str,
+        csv_content: str | Iterable[str],
         s3_url: str,
         agent_id: str | None = None
     ) -> CampaignResponse:
         try:
-            campaign_id = f"CAMP-{str(uuid.uuid4())[:8].upper()}"
+            campaign_id = f"CAMP-{os.urandom(4).hex().upper()}"
             now = datetime.utcnow()
 
-            leads = await self._process_csv_leads(csv_content, campaign_request.data_mapping)
-
-            async with await get_db_connection() as conn:
+            async with await get_json_db_connection() as conn:
                 campaign_query = """
                 INSERT INTO Campaign (
                     id, campaign_name, description, company_id, created_by, 
@@ -96,23 +508,47 @@ class CampaignService:
                 RETURNING *
                 """
                 
-                campaign_record = await conn.fetchrow(
-                    campaign_query,
-                    campaign_id,
-                    campaign_request.campaign_name,
-                    campaign_request.description,
-                    company_id,
-                    created_by,
-                    'queued',
-                    len(leads),
-                    json.dumps([mapping.dict() for mapping in campaign_request.data_mapping]),
-                    json.dumps(campaign_request.booking.dict()),
-                    json.dumps(campaign_request.automation.dict()),
-                    s3_url,
-                    agent_id or campaign_request.agent_id,
-                    now,
-                    now
-                )
+                # The campaign row and its leads are committed together so a bad
+                # CSV row never leaves behind a campaign without its leads.
+                async with conn.transaction():
+                    # Don't wait for the WAL flush on commit. A database crash
+                    # right after we return can lose this campaign (all of it,
+                    # never half), which is acceptable for an upload the user
+                    # can simply retry.
+                    await conn.execute("SET LOCAL synchronous_commit = off")
+                    campaign_record = await conn.fetchrow(
+                        campaign_query,
+                        campaign_id,
+                        campaign_request.campaign_name,
+                        campaign_request.description,
+                        company_id,
+                        created_by,
+                        'queued',
+                        0,
+                        _DATA_MAPPING_LIST.dump_json(campaign_request.data_mapping),
+                        campaign_request.booking.model_dump_json(),
+                        campaign_request.automation.model_dump_json(),
+                        s3_url,
+                        agent_id or campaign_request.agent_id,
+                        now,
+                        now
+                    )
+
+                    # Leads are streamed from the CSV straight into COPY, so the
+                    # count is only known once the rows have been sent.
+                    core_columns, custom_columns = _split_lead_mapping(campaign_request.data_mapping)
+                    leads_count = await self._create_campaign_leads(
+                        conn,
+                        campaign_id,
+                        [field for _, field in custom_columns],
+                        self._process_csv_leads(csv_content, core_columns, custom_columns, campaign_id, now)
+                    )
+                    if leads_count:
+                        campaign_record = await conn.fetchrow(
+                            "UPDATE Campaign SET leads_count = $2 WHERE id = $1 RETURNING *",
+                            campaign_id,
+                            leads_count
+                        )
 
                 try:
                     await self.activity_queries.create_activity(
@@ -125,16 +561,14 @@ class CampaignService:
                             "campaign_name": campaign_request.campaign_name,
                             "company_id": company_id,
                             "agent_id": agent_id or campaign_request.agent_id,
-                            "leads_count": len(leads)
+                            "leads_count": leads_count
                         }
                     )
                 except Exception as e:
                     logger.warning(f"Campaign activity logging failed: {e}")
 
-                if leads:
-                    await self._create_campaign_leads(conn, campaign_id, leads)
-
-                return self._to_campaign_response(dict(campaign_record))
+                self._invalidate_campaign_cache(campaign_id, company_id)
+                return self._to_campaign_response(campaign_record)
 
         except Exception as e:
             logger.error(f"Error creating campaign: {str(e)}")
@@ -142,102 +576,121 @@ class CampaignService:
 
 
 
-    async def _process_csv_leads(
+    def _process_csv_leads(
         self, 
-        csv_content: str, 
-        data_mapping: List[DataMapping]
-    ) -> List[Dict[str, Any]]:
-        
-        leads = []
-        try:
-            csv_reader = csv.DictReader(io.StringIO(csv_content))
+        csv_content: str | Iterable[str], 
+        core_columns: list,
+        custom_columns: list,
+        campaign_id: str,
+        now: datetime
+    ) -> Iterator[tuple]:
+        """
+        Yield staging rows (in CAMPAIGN_LEAD_COPY_COLUMNS order) one CSV row at
+        a time. core_columns/custom_columns come from _split_lead_mapping.
+        """
+        csv_reader = csv.reader(_csv_lines(csv_content))
+        header = next(csv_reader, None)
+        if header is None:
+            return
 
-            column_mapping = {mapping.csv_column: mapping.mapped_to for mapping in data_mapping}
-            
-            for row in csv_reader:
-                lead = {
-                    'id': f"LEAD-{str(uuid.uuid4())[:8].upper()}",
-                    'first_name': None,
-                    'last_name': None,
-                    'email': None,
-                    'phone': None,
-                    'company': None,
-                    'country_code': None,
-                    'custom_fields': {},
-                    'call_attempts': 0,
-                    'last_call_at': None,
-                    'status': 'pending'
-                }
+        # Resolve mapped columns to positions once; rows are then indexed
+        # directly instead of being turned into a dict each.
+        column_index = {name: i for i, name in enumerate(header)}
+        # (csv index, slot in LEAD_CORE_FIELDS) so each row fills a flat list
+        core_indexes = [
+            (column_index[col], LEAD_CORE_FIELDS.index(field))
+            for col, field in core_columns if col in column_index
+        ]
+        # Kept aligned with custom_columns. A column missing from the CSV reads
+        # the '' appended to every row (index -1), so it stays NULL without a
+        # per-cell check.
+        custom_indexes = [column_index.get(col, -1) for col, _ in custom_columns]
+        width = len(header)
+        empty_lead = [None] * len(LEAD_CORE_FIELDS)
+
+        for row, lead_id in zip(csv_reader, _iter_lead_ids()):
+            if not row:
+                continue  # blank line, skipped like DictReader does
+            if len(row) < width:
+                row.extend([''] * (width - len(row)))
+            row.append('')
 
-                for csv_col, mapped_field in column_mapping.items():
-                    if csv_col in row and row[csv_col] and row[csv_col].strip() != "":
-                        value = row[csv_col].strip()
-                        if mapped_field in ['first_name', 'last_name', 'email', 'phone', 'company', 'country_code']:
-                            lead[mapped_field] = value
-                        else:
-                            lead['custom_fields'][mapped_field] = value
-                
-                leads.append(lead)
-                
-        except Exception as e:
-            logger.error(f"Error processing CSV: {str(e)}")
-            raise Exception(f"Failed to process CSV: {str(e)}")
-        
-        return leads
+            lead = empty_lead.copy()
+
+            for i, slot in core_indexes:
+                value = row[i].strip()
+                if value:
+                    lead[slot] = value
+
+            first_name, last_name, email, phone, company, country_code = lead
+            custom_values = [row[i].strip() or None for i in custom_indexes]
+
+            yield (
+                lead_id,
+                campaign_id,
+                first_name,
+                last_name,
+                email,
+                phone,
+                company,
+                custom_values,
+                0,
+                None,
+                'pending',
+                now,
+                now,
+                country_code,
+                _normalize_to_number(phone, country_code)
+            )
 
 
     async def _create_campaign_leads(
         self, 
         conn, 
         campaign_id: str, 
-        leads: List[Dict[str, Any]]
-    ):
-        
-        lead_query = """
-        INSERT INTO campaign_lead (
-            id,
-            campaign_id,
-            first_name,
-            last_name,
-            email,
-            phone,
-            company,
-            custom_fields,
-            call_attempts,
-            last_call_at,
-            status,
-            created_at,
-            updated_at,
-            country_code
-        ) VALUES (
-            $1, $2, $3, $4, $5, $6, $7, $8::jsonb, $9, $10, $11, $12, $13, $14
-        )
-        ON CONFLICT (id) DO NOTHING
+        custom_keys: List[str],
+        records: Iterable[tuple]
+    ) -> int:
         """
-        
-        now = datetime.utcnow()
-        for lead in leads:
-            await conn.execute(
-                lead_query,
-                lead['id'],
-                campaign_id,
-                lead.get('first_name'),
-                lead.get('last_name'),
-                lead.get('email'),
-                lead.get('phone'),
-                lead.get('company'),
-                json.dumps(lead.get('custom_fields', {})),
-                lead.get('call_attempts', 0),
-                lead.get('last_call_at'),
-                lead.get('status', 'pending'),
-                now,
-                now,
-                lead.get('country_code')
+        Bulk-load lead records with binary COPY. Rows go through a temp staging
+        table so duplicate ids are still skipped like ON CONFLICT (id) DO NOTHING.
+        custom_keys names the entries of each record's custom_values.
+        Returns the number of records read from the source.
+        """
+        counted = _CountingIterator(records)
+
+        async with conn.transaction():
+            await conn.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS campaign_lead_staging
+                (LIKE campaign_lead INCLUDING DEFAULTS, custom_values TEXT[])
+                ON COMMIT DELETE ROWS
+            """)
+            # Called once per page inside an outer transaction by
+            # import_leads_csv, so earlier pages' rows may still be staged
+            await conn.execute("TRUNCATE campaign_lead_staging")
+            await conn.copy_records_to_table(
+                'campaign_lead_staging',
+                records=counted,
+                columns=CAMPAIGN_LEAD_COPY_COLUMNS,
+                timeout=LEAD_COPY_TIMEOUT
             )
+            await conn.execute(f"""
+                INSERT INTO campaign_lead ({_CAMPAIGN_LEAD_INSERT_COLUMNS})
+                SELECT {_CAMPAIGN_LEAD_STAGING_SELECT} FROM campaign_lead_staging
+                ON CONFLICT (id) DO NOTHING
+            """, custom_keys, timeout=LEAD_COPY_TIMEOUT)
+
+        return counted.count
 
     async def get_campaign(self, campaign_id: str, company_id: str) -> Optional[CampaignResponse]:      
+        # Copies, so a caller mutating the response (e.g. the booking's
+        # calendar_credentials dict) can't change what the cache serves.
+        cached = _campaign_cache.get((campaign_id, company_id))
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
         try:
-            async with await get_db_connection() as conn:
+            async with await get_json_db_connection() as conn:
                 query = """
                 SELECT * FROM Campaign 
                 WHERE id = $1 AND company_id = $2
@@ -248,44 +701,119 @@ class CampaignService:
                 if not campaign:
                     return None
                 
-                return self._to_campaign_response(dict(campaign))
+                response = self._to_campaign_response(campaign)
+                _campaign_cache.set((campaign_id, company_id), response)
+                return response.model_copy(deep=True)
                 
         except Exception as e:
             logger.error(f"Error fetching campaign: {str(e)}")
             return None
 
+    async def campaign_exists(self, campaign_id: str, company_id: str) -> bool:
+        """Uncached existence check; unlike get_campaign, database errors propagate"""
+        async with await get_db_connection() as conn:
+            return await conn.fetchval(
+                "SELECT EXISTS (SELECT 1 FROM Campaign WHERE id = $1 AND company_id = $2)",
+                campaign_id, company_id
+            )
+
+    async def get_campaign_detail(
+        self,
+        campaign_id: str,
+        company_id: str,
+        leads_limit: int = 100
+    ) -> Optional[Dict[str, Any]]:
+        """Campaign, its total lead count and the newest page of leads in one round-trip"""
+        async with await get_json_db_connection() as conn:
+            row = await conn.fetchrow("""
+                WITH c AS (
+                    SELECT * FROM Campaign
+                    WHERE id = $1 AND company_id = $2
+                )
+                SELECT
+                    c.*,
+                    (SELECT COUNT(*) FROM Campaign_Lead WHERE campaign_id = $1) AS leads_total,
+                    (
+                        SELECT COALESCE(json_agg(l), '[]'::json)
+                        FROM (
+                            SELECT * FROM Campaign_Lead
+                            WHERE campaign_id = $1
+                            ORDER BY created_at DESC
+                            LIMIT $3
+                        ) l
+                    ) AS leads
+                FROM c
+            """, campaign_id, company_id, leads_limit)
+
+        if not row:
+            return None
+
+        campaign = self._to_campaign_response(row)
+        _campaign_cache.set((campaign_id, company_id), campaign)
+
+        return {
+            "campaign": campaign,
+            "leads_total": row["leads_total"],
+            "leads": row["leads"]
+        }
+
     async def get_campaigns_by_company(
         self,
         company_id: str,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        before: Optional[Tuple[datetime, str]] = None
     ) -> List[CampaignResponse]:
+        """
+        Newest campaigns first. Pass the (created_at, id) of the last campaign
+        of a page as `before` to get the next page by index seek instead of
+        OFFSET; `offset` is ignored when `before` is given.
+        """
 
-        try:
-            async with await get_db_connection() as conn:
-                query = """
-                SELECT
-                    c.*,
-                    a.name AS agent_name
-                FROM Campaign c
-                LEFT JOIN "Agent" a
-                    ON a.id = c.agent_id
-                WHERE c.company_id = $1
-                ORDER BY c.created_at DESC
-                LIMIT $2 OFFSET $3
-                """
+        cache_key = (company_id, limit, offset, before)
+        cached = _company_campaigns_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
 
-                rows = await conn.fetch(query, company_id, limit, offset)
+        try:
+            async with await get_json_db_connection() as conn:
+                if before is not None:
+                    rows = await conn.fetch(COMPANY_CAMPAIGNS_BEFORE_QUERY, company_id, *before, limit)
+                else:
+                    query = COMPANY_CAMPAIGNS_QUERY + "LIMIT $2 OFFSET $3"
+                    rows = await conn.fetch(query, company_id, limit, offset)
 
-                return [
-                    self._to_campaign_response(dict(row))
-                    for row in rows
-                ]
+                campaigns = [self._to_campaign_response(row) for row in rows]
+                _company_campaigns_cache.set(cache_key, campaigns)
+                return list(campaigns)
 
         except Exception as e:
             logger.error(f"Error fetching campaigns: {str(e)}")
             return []
 
+    async def iter_campaigns_by_company(self, company_id: str) -> AsyncIterator[CampaignResponse]:
+        """
+        Yield every campaign of a company in keyset pages of
+        CAMPAIGN_STREAM_PAGE_SIZE, so large result sets are never fully
+        materialised in memory. The connection is held only while a page is
+        fetched, never while the consumer (e.g. a slow HTTP client) reads.
+        """
+        async with await get_json_db_connection() as conn:
+            rows = await conn.fetch(
+                COMPANY_CAMPAIGNS_QUERY + "LIMIT $2", company_id, CAMPAIGN_STREAM_PAGE_SIZE
+            )
+        while rows:
+            for row in rows:
+                yield self._to_campaign_response(row)
+            if len(rows) < CAMPAIGN_STREAM_PAGE_SIZE:
+                return
+            last = rows[-1]
+            async with await get_json_db_connection() as conn:
+                rows = await conn.fetch(
+                    COMPANY_CAMPAIGNS_BEFORE_QUERY,
+                    company_id, last["created_at"], last["id"], CAMPAIGN_STREAM_PAGE_SIZE
+                )
+
     async def update_campaign(
         self,
         campaign_id: str,
@@ -311,11 +839,11 @@ class CampaignService:
 
         if payload.data_mapping is not None:
             set_clauses.append(f"data_mapping = ${len(values)+1}")
-            values.append(json.dumps([m.dict() for m in payload.data_mapping]))
+            values.append(_DATA_MAPPING_LIST.dump_json(payload.data_mapping))
 
         if payload.booking is not None:
             set_clauses.append(f"booking_config = ${len(values)+1}")
-            values.append(json.dumps(payload.booking.dict()))
+            values.append(payload.booking.model_dump_json())
     
         if payload.status is not None:
             set_clauses.append(f"status = ${len(values)+1}")
@@ -323,7 +851,7 @@ class CampaignService:
 
         if payload.automation is not None:
             set_clauses.append(f"automation_config = ${len(values)+1}")
-            values.append(json.dumps(payload.automation.dict()))
+            values.append(payload.automation.model_dump_json())
 
         if not set_clauses:
             return await self.get_campaign(campaign_id, company_id)
@@ -342,7 +870,7 @@ class CampaignService:
         RETURNING *;
         """
 
-        updated_fields = payload.dict(exclude_unset=True).keys()
+        updated_fields = payload.model_fields_set
 
         try:
             async with await get_db_connection() as conn:
@@ -359,11 +887,12 @@ class CampaignService:
         except Exception as e:
             logger.warning(f"Campaign update activity failed: {e}")
 
-        async with await get_db_connection() as conn:
+        async with await get_json_db_connection() as conn:
             row = await conn.fetchrow(query, *values)
+            self._invalidate_campaign_cache(campaign_id, company_id)
             if not row:
                 return None
-            return self._to_campaign_response(dict(row))
+            return self._to_campaign_response(row)
 
 
     async def delete_campaign(self, campaign_id: str, company_id: str) -> bool:
@@ -373,6 +902,7 @@ class CampaignService:
                 "DELETE FROM Campaign WHERE id = $1 AND company_id = $2",
                 campaign_id, company_id
             )
+            self._invalidate_campaign_cache(campaign_id, company_id)
             await self.activity_queries.create_activity(
                 conn=conn,
                 user_id=company_id,
@@ -385,7 +915,7 @@ class CampaignService:
             )
             return result.startswith("DELETE 1")
 
-    async def get_agents(self, campaign_id: str) -> list[dict]:
+    async def get_agents(self, campaign_id: str) -> List[Record]:
         sql = """
             SELECT a.*
             FROM   campaign_agents ca
@@ -394,16 +924,18 @@ class CampaignService:
         """
         async with await get_db_connection() as conn:
             rows = await conn.fetch(sql, campaign_id)
-        return [dict(r) for r in rows]
+        return rows
 
     async def assign_agents(self, campaign_id: str, agent_ids: list[str]) -> None:
+        if not agent_ids:
+            return
         async with await get_db_connection() as conn:
-            for aid in agent_ids:
-                await conn.execute(
-                    """INSERT INTO campaign_agents (campaign_id, agent_id)
-                       VALUES ($1,$2)               ON CONFLICT DO NOTHING""",
-                    campaign_id, aid
-                )
+            await conn.execute(
+                """INSERT INTO campaign_agents (campaign_id, agent_id)
+                   SELECT $1, agent_id FROM unnest($2::text[]) AS agent_id
+                   ON CONFLICT DO NOTHING""",
+                campaign_id, agent_ids
+            )
 
     async def unassign_agent(self, campaign_id: str, agent_id: str) -> bool:
         async with await get_db_connection() as conn:
@@ -420,26 +952,44 @@ class CampaignService:
         user_id: str,
         agent_handler,
     ) -> int:
+        """
+        Apply the provided settings to every agent assigned to the campaign
+        with a single UPDATE, instead of one agent_handler.update_agent call
+        per agent. agent_handler is kept for callers' signature compatibility.
+        """
+        updates = settings.model_dump(exclude_none=True)
+
         async with await get_db_connection() as conn:
-            ids = await conn.fetch(
-                "SELECT agent_id FROM campaign_agents WHERE campaign_id=$1",
-                campaign_id,
-            )
-        agent_ids = [r["agent_id"] for r in ids]
+            if not updates:
+                return await conn.fetchval(
+                    "SELECT COUNT(*) FROM campaign_agents WHERE campaign_id=$1",
+                    campaign_id,
+                )
 
-        if not agent_ids:
-            return 0
+            set_clauses = [f"{field} = ${i}" for i, field in enumerate(updates, start=2)]
+            rows = await conn.fetch(f"""
+                UPDATE "Agent"
+                SET {', '.join(set_clauses)}, updated_at = NOW()
+                WHERE id IN (SELECT agent_id FROM campaign_agents WHERE campaign_id = $1)
+                RETURNING id
+            """, campaign_id, *updates.values())
+            agent_ids = [r["id"] for r in rows]
+
+            if agent_ids:
+                try:
+                    await conn.execute("""
+                        INSERT INTO activities (id, user_id, action, entity_type, entity_id, metadata, created_at)
+                        SELECT a.id, $2, 'UPDATE', 'AGENT', a.agent_id, $4, NOW()
+                        FROM unnest($1::text[], $3::text[]) AS a(id, agent_id)
+                    """,
+                        [str(uuid.uuid4()) for _ in agent_ids],
+                        user_id,
+                        agent_ids,
+                        _dumps({"updated_fields": list(updates)})
+                    )
+                except Exception as e:
+                    logger.warning(f"Agent settings activity logging failed: {e}")
 
-        patch = AgentUpdate(
-            is_active=settings.is_active,
-            max_response_tokens=settings.max_response_tokens,
-            temperature=settings.temperature,
-        )
-        jobs = [
-            agent_handler.update_agent(aid, patch, user_id)
-            for aid in agent_ids
-        ]
-        await asyncio.gather(*jobs)
         return len(agent_ids)
 
     async def get_campaign_metrics_summary(self, campaign_id: str) -> dict:
@@ -494,6 +1044,10 @@ class CampaignService:
             if durations else 0
         )
 
+        return self._metrics_summary(contacted, responded, converted, len(bookings), avg_duration)
+
+    @staticmethod
+    def _metrics_summary(contacted: int, responded: int, converted: int, booked: int, avg_duration: int) -> dict:
         response_rate = round(
             (responded / contacted) * 100, 2
         ) if contacted else 0
@@ -506,29 +1060,85 @@ class CampaignService:
             "contacted": contacted,
             "responded": responded,
             "response_rate": response_rate,
-            "booked": len(bookings),
+            "booked": booked,
             "converted": converted,
             "conversion_rate": conversion_rate,
             "avg_call_duration_seconds": avg_duration
         }
 
+    async def get_campaign_dashboard(self, campaign_id: str, calls_limit: int = 100) -> dict:
+        """
+        Metrics summary, bookings and recent calls for the campaign dashboard
+        on a single connection. The metrics are aggregated in SQL instead of
+        fetching every call row, and bookings are read once for both the
+        list and the booked count.
+        """
+        async with await get_db_connection() as conn:
+            totals = await conn.fetchrow("""
+                SELECT
+                    COUNT(*) AS contacted,
+                    COUNT(*) FILTER (WHERE status = 'completed') AS responded,
+                    COUNT(*) FILTER (
+                        WHERE status = 'completed'
+                        AND to_number IN (
+                            SELECT customer_phone
+                            FROM booking
+                            WHERE campaign_id = $1
+                            AND customer_phone <> ''
+                        )
+                    ) AS converted,
+                    AVG(duration) AS avg_duration
+                FROM "Call"
+                WHERE campaign_id = $1
+                AND call_type = 'outgoing'
+            """, campaign_id)
+
+            bookings = await conn.fetch("""
+                SELECT *
+                FROM   booking
+                WHERE  campaign_id = $1
+                ORDER  BY slot_start DESC
+            """, campaign_id)
+
+            calls = await conn.fetch("""
+                SELECT *
+                FROM "Call"
+                WHERE campaign_id = $1
+                AND call_type = 'outgoing'
+                ORDER BY created_at DESC
+                LIMIT $2
+            """, campaign_id, calls_limit)
+
+        avg_duration = totals["avg_duration"]
+        return {
+            "metrics": self._metrics_summary(
+                totals["contacted"],
+                totals["responded"],
+                totals["converted"],
+                len(bookings),
+                int(avg_duration) if avg_duration is not None else 0
+            ),
+            "bookings": [dict(r) for r in bookings],
+            "calls": [dict(r) for r in calls]
+        }
+
 
 
     async def get_metrics_history(
         self, campaign_id: str, days_back: int = 30
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Record]:
         sql = """
             SELECT *
             FROM   campaign_metrics_daily
             WHERE  campaign_id = $1
-              AND  date >= $2
+              AND  date >= CURRENT_DATE - $2::int
             ORDER  BY date
         """
         async with await get_db_connection() as conn:
-            rows = await conn.fetch(sql, campaign_id, date.today().fromordinal(date.today().toordinal()-days_back))
-        return [dict(r) for r in rows]
+            rows = await conn.fetch(sql, campaign_id, days_back)
+        return rows
 
-    async def get_overall_summary(self) -> List[Dict[str, Any]]:
+    async def get_overall_summary(self) -> List[Record]:
         sql = """
             SELECT
               campaign_id,
@@ -541,9 +1151,9 @@ class CampaignService:
         """
         async with await get_db_connection() as conn:
             rows = await conn.fetch(sql)
-        return [dict(r) for r in rows]
+        return rows
 
-    async def get_call_logs(self, campaign_id: str, limit: int = 100) -> List[Dict]:
+    async def get_call_logs(self, campaign_id: str, limit: int = 100) -> List[Record]:
         sql = """
             SELECT *
             FROM   call_log
@@ -553,9 +1163,9 @@ class CampaignService:
         """
         async with await get_db_connection() as conn:
             rows = await conn.fetch(sql, campaign_id, limit)
-        return [dict(r) for r in rows]
+        return rows
 
-    async def get_bookings(self, campaign_id: str) -> List[Dict]:
+    async def get_bookings(self, campaign_id: str) -> List[Record]:
         sql = """
             SELECT *
             FROM   booking
@@ -564,87 +1174,159 @@ class CampaignService:
         """
         async with await get_db_connection() as conn:
             rows = await conn.fetch(sql, campaign_id)
-        return [dict(r) for r in rows]
+        return rows
 
-    async def import_leads_csv(self, campaign_id: str, csv_content: str, user_id: str) -> int:
-            reader = csv.DictReader(io.StringIO(csv_content))
-            leads = []
-            
-            for row in reader:
-                lead = await self.get_or_create_lead(row)
-                lead_id = f"LEAD-{uuid.uuid4().hex[:8].upper()}"
-                leads.append((
+    async def import_leads_csv(
+        self,
+        campaign_id: str,
+        csv_content: str | Iterable[str],
+        user_id: str,
+        company_id: str
+    ) -> int:
+        now = datetime.utcnow()
+
+        def rows():
+            """(campaign_lead COPY record, master lead fields) per CSV row"""
+            csv_reader = csv.reader(_csv_lines(csv_content))
+            header = next(csv_reader, None)
+            if header is None:
+                return
+
+            # Only the columns the master lead and the COPY row read are
+            # picked out of each row, by position.
+            column_index = {name: i for i, name in enumerate(header)}
+            picked = [(field, column_index[field]) for field in IMPORT_LEAD_COLUMNS if field in column_index]
+            width = len(header)
+
+            for row, lead_id in zip(csv_reader, _iter_lead_ids()):
+                if not row:
+                    continue
+                if len(row) < width:
+                    row.extend([''] * (width - len(row)))
+
+                lead_data = {field: row[i] for field, i in picked}
+                email = lead_data.get('email', '').strip().lower()
+                if not email:
+                    raise ValueError("Email is required for lead creation")
+                master_lead = (
+                    email,
+                    lead_data.get('first_name'),
+                    lead_data.get('last_name'),
+                    lead_data.get('phone'),
+                    lead_data.get('lead_company'),
+                    lead_data.get('company'),
+                    # JSON-encoded server-side by to_jsonb()
+                    lead_data.get('custom_fields'),
+                    lead_data.get('source', 'csv_import'),
+                )
+
+                phone = lead_data.get('phone', '')
+                country_code = lead_data.get('country_code') or None
+                record = (
                     lead_id,
                     campaign_id,
-                    row.get('first_name', ''),
-                    row.get('last_name', ''),
-                    row.get('email', ''),
-                    row.get('phone', ''),
-                    row.get('company', ''),
-                    '{}',
-                    datetime.utcnow(),
-                    datetime.utcnow()
-                ))
-                await self.add_lead_to_campaign(lead['id'], campaign_id)
-            
-            async with await get_db_connection() as conn:
-                await conn.executemany("""
-                    INSERT INTO Campaign_Lead 
-                    (id, campaign_id, first_name, last_name, email, phone, company, custom_fields, created_at, updated_at)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-                """, leads)
-            
-            return len(leads)
+                    lead_data.get('first_name', ''),
+                    lead_data.get('last_name', ''),
+                    lead_data.get('email', ''),
+                    phone,
+                    lead_data.get('company', ''),
+                    [],
+                    0,
+                    None,
+                    'pending',
+                    now,
+                    now,
+                    country_code,
+                    _normalize_to_number(phone, country_code)
+                )
+                yield record, master_lead
+
+        # Same COPY + staging path as campaign creation, so imported leads get
+        # to_number for the dialer and duplicate ids are skipped. Each page is
+        # copied and its master leads upserted before the next is parsed; all
+        # pages commit together.
+        count = 0
+        company_uuid = uuid.UUID(company_id)
+        pending = rows()
+        async with await get_db_connection() as conn:
+            async with conn.transaction():
+                while page := list(islice(pending, LEAD_IMPORT_PAGE_SIZE)):
+                    records, master_leads = zip(*page)
+                    count += await self._create_campaign_leads(conn, campaign_id, [], records)
+                    (emails, first_names, last_names, phones,
+                     lead_companies, companies, custom_fields, sources) = map(list, zip(*master_leads))
+                    await conn.execute(
+                        _IMPORT_FILL_LEADS_SQL, company_uuid,
+                        emails, first_names, last_names, phones, lead_companies
+                    )
+                    await conn.execute(
+                        _IMPORT_INSERT_LEADS_SQL, company_uuid,
+                        emails, first_names, last_names, phones, companies,
+                        custom_fields, sources, now
+                    )
+                    await conn.execute(
+                        _IMPORT_LINK_LEADS_SQL, campaign_id, company_uuid, emails, now
+                    )
+        return count
     
-    async def get_leads(self, campaign_id: str, offset: int = 0, limit: int = 100) -> List[Dict]:
+    async def get_leads(
+        self,
+        campaign_id: str,
+        offset: int = 0,
+        limit: int = 100,
+        before: Optional[Tuple[datetime, str]] = None
+    ) -> List[Record]:
+        """
+        Newest leads first. Pass the (created_at, id) of the last lead of a
+        page as `before` to get the next page by index seek instead of OFFSET;
+        `offset` is ignored when `before` is given.
+        """
         async with await get_db_connection() as conn:
-            rows = await conn.fetch("""
-                SELECT * FROM Campaign_Lead 
-                WHERE campaign_id = $1 
-                ORDER BY created_at DESC 
-                OFFSET $2 LIMIT $3
-            """, campaign_id, offset, limit)
-        return [dict(row) for row in rows]
+            if before is not None:
+                rows = await conn.fetch("""
+                    SELECT * FROM Campaign_Lead 
+                    WHERE campaign_id = $1 
+                    AND (created_at, id) < ($2, $3)
+                    ORDER BY created_at DESC, id DESC 
+                    LIMIT $4
+                """, campaign_id, *before, limit)
+            else:
+                rows = await conn.fetch("""
+                    SELECT * FROM Campaign_Lead 
+                    WHERE campaign_id = $1 
+                    ORDER BY created_at DESC, id DESC 
+                    OFFSET $2 LIMIT $3
+                """, campaign_id, offset, limit)
+        return rows
     
-    async def get_all_leads(self, campaign_id: str) -> List[Dict]:
+    async def get_all_leads(self, campaign_id: str) -> List[Record]:
+        """
+        Export rows, in LEAD_EXPORT_COLUMNS order, so they can be written out
+        as they are.
+        """
         async with await get_db_connection() as conn:
-            rows = await conn.fetch("""
-                SELECT * FROM Campaign_Lead 
+            rows = await conn.fetch(f"""
+                SELECT {', '.join(LEAD_EXPORT_COLUMNS)} FROM Campaign_Lead 
                 WHERE campaign_id = $1 
                 ORDER BY created_at DESC
             """, campaign_id)
-        return [dict(row) for row in rows]
+        return rows
     
     async def add_lead(self, campaign_id: str, lead: LeadCreate, user_id: str) -> Dict:
-        lead_id = f"LEAD-{uuid.uuid4().hex[:8].upper()}"
+        lead_id = f"LEAD-{os.urandom(4).hex().upper()}"
         now = datetime.utcnow()
         
         async with await get_db_connection() as conn:
-            row = await conn.fetchrow("""
-                INSERT INTO Campaign_Lead 
-                (id, campaign_id, first_name, last_name, email, phone, company, custom_fields, created_at, updated_at)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-                RETURNING *
-            """, lead_id, campaign_id, lead.first_name, lead.last_name, 
+            row = await conn.fetchrow(_ADD_LEAD_SQL, lead_id, campaign_id, lead.first_name, lead.last_name, 
                  lead.email, lead.phone, lead.company, 
-                 json.dumps(lead.custom_fields or {}), now, now)
+                 _dumps(lead.custom_fields or {}), now, now)
         
         return dict(row)
-    
+
     async def update_lead(self, campaign_id: str, lead_id: str, lead: LeadUpdate, user_id: str) -> Dict:
-        set_clauses = []
-        values = []
-        
-        updates = lead.dict(exclude_unset=True)
-        for field, value in updates.items():
-            if field == 'custom_fields':
-                set_clauses.append(f"custom_fields = ${len(values)+1}::jsonb")
-                values.append(json.dumps(value))
-            else:
-                set_clauses.append(f"{field} = ${len(values)+1}")
-                values.append(value)
+        updates = lead.model_dump(exclude_unset=True)
         
-        if not set_clauses:
+        if not updates:
             async with await get_db_connection() as conn:
                 row = await conn.fetchrow(
                     "SELECT * FROM Campaign_Lead WHERE id = $1 AND campaign_id = $2",
@@ -652,12 +1334,15 @@ class CampaignService:
                 )
             return dict(row) if row else None
         
-        set_clauses.append("updated_at = CURRENT_TIMESTAMP")
+        fields = tuple(updates)
+        values = _lead_update_values(updates)
         values.extend([lead_id, campaign_id])
         
-        query = f"""
+        query = _LEAD_UPDATE_SQL_CACHE.get(fields)
+        if query is None:
+            query = _LEAD_UPDATE_SQL_CACHE[fields] = f"""
             UPDATE Campaign_Lead 
-            SET {', '.join(set_clauses)}
+            SET {_lead_set_clause(fields)}
             WHERE id = ${len(values)-1} AND campaign_id = ${len(values)}
             RETURNING *
         """
@@ -679,31 +1364,23 @@ class CampaignService:
         if not bulk.lead_ids:
             return 0
         
-        set_clauses = []
-        values = []
-        
-        updates = bulk.updates.dict(exclude_unset=True)
-        for field, value in updates.items():
-            if field == 'custom_fields':
-                set_clauses.append(f"{field} = ${len(values)+1}::jsonb")
-                values.append(json.dumps(value))
-            else:
-                set_clauses.append(f"{field} = ${len(values)+1}")
-                values.append(value)
-        
-        if not set_clauses:
+        updates = bulk.updates.model_dump(exclude_unset=True)
+        if not updates:
             return 0
         
-        set_clauses.append("updated_at = CURRENT_TIMESTAMP")
-
-        placeholders = ', '.join(f'${i}' for i in range(len(values)+1, len(values)+1+len(bulk.lead_ids)))
-        values.extend(bulk.lead_ids)
+        fields = tuple(updates)
+        values = _lead_update_values(updates)
+        # The ids travel as one array parameter, so the statement text (and its
+        # prepared plan) is the same whatever the number of leads.
+        values.append(list(bulk.lead_ids))
         values.append(campaign_id)
         
-        query = f"""
+        query = _LEAD_BULK_UPDATE_SQL_CACHE.get(fields)
+        if query is None:
+            query = _LEAD_BULK_UPDATE_SQL_CACHE[fields] = f"""
             UPDATE Campaign_Lead 
-            SET {', '.join(set_clauses)}
-            WHERE id IN ({placeholders}) AND campaign_id = ${len(values)}
+            SET {_lead_set_clause(fields)}
+            WHERE id = ANY(${len(values)-1}::text[]) AND campaign_id = ${len(values)}
         """
         
         async with await get_db_connection() as conn:
@@ -724,19 +1401,20 @@ class CampaignService:
         delimiter = self._detect_csv_delimiter(csv_content)
         
         reader = csv.reader(io.StringIO(csv_content), delimiter=delimiter)
-        rows = list(reader)
+        headers = next(reader, None)
         
-        if not rows:
+        if headers is None:
             raise ValueError("CSV file is empty")
         
-        headers = rows[0] if rows else []
-        data_rows = rows[1:] if len(rows) > 1 else []
-        preview = data_rows[:preview_rows]
+        # Only the preview rows are kept; the rest are parsed just to be
+        # counted, so large uploads are never held as a list of rows.
+        preview = list(islice(reader, preview_rows))
+        total_rows = len(preview) + sum(1 for _ in reader)
         
         return CSVParseResponse(
             headers=headers,
             preview_rows=preview,
-            total_rows=len(data_rows),
+            total_rows=total_rows,
             detected_delimiter=delimiter
         )
     
@@ -744,8 +1422,8 @@ class CampaignService:
         errors = []
         delimiter = self._detect_csv_delimiter(request.csv_content)
         
-        reader = csv.DictReader(io.StringIO(request.csv_content), delimiter=delimiter)
-        headers = reader.fieldnames or []
+        reader = csv.reader(io.StringIO(request.csv_content), delimiter=delimiter)
+        headers = next(reader, None) or []
 
         if request.expected_headers:
             missing_headers = set(request.expected_headers) - set(headers)
@@ -757,39 +1435,50 @@ class CampaignService:
                     value=str(headers)
                 ))
         
+        # Resolve every checked column to its position once; the row loop
+        # then only indexes lists.
+        column_index = {name: i for i, name in enumerate(headers)}
+        required = [
+            (field, column_index[field])
+            for field in request.required_fields or ()
+            if field in column_index
+        ]
+        checks = [
+            (column, column_index[column], match, message)
+            for column, match, message in (
+                ('email', EMAIL_RE.match, "Invalid email format"),
+                ('phone', PHONE_RE.match, "Invalid phone format"),
+            )
+            if column in column_index
+        ]
+        width = len(headers)
         row_count = 0
-        email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-        phone_pattern = re.compile(r'^[\+]?[1-9]?[\d\s\-\(\)]{7,15}$')
         
-        for row_num, row in enumerate(reader, start=2):
+        for row in reader:
+            if not row:
+                continue  # blank line, skipped like DictReader does
             row_count += 1
+            row_num = row_count + 1
+            if len(row) < width:
+                row.extend([''] * (width - len(row)))
 
-            if request.required_fields:
-                for field in request.required_fields:
-                    if field in row and not row[field].strip():
-                        errors.append(CSVValidationError(
-                            row=row_num,
-                            column=field,
-                            error="Required field is empty",
-                            value=row[field]
-                        ))
-            
-            if 'email' in row and row['email'].strip():
-                if not email_pattern.match(row['email'].strip()):
+            for field, i in required:
+                if not row[i].strip():
                     errors.append(CSVValidationError(
                         row=row_num,
-                        column='email',
-                        error="Invalid email format",
-                        value=row['email']
+                        column=field,
+                        error="Required field is empty",
+                        value=row[i]
                     ))
 
-            if 'phone' in row and row['phone'].strip():
-                if not phone_pattern.match(row['phone'].strip()):
+            for column, i, match, message in checks:
+                value = row[i].strip()
+                if value and not match(value):
                     errors.append(CSVValidationError(
                         row=row_num,
-                        column='phone',
-                        error="Invalid phone format",
-                        value=row['phone']
+                        column=column,
+                        error=message,
+                        value=row[i]
                     ))
         
         return CSVValidateResponse(
@@ -805,31 +1494,32 @@ class CampaignService:
     
     async def map_csv_fields(self, request: CSVMapFieldsRequest) -> CSVMapFieldsResponse:
         """Handle CSV field mapping logic"""
-        mapped_fields = {}
-        unmapped_columns = []
-        missing_required = []
-
-        mapping_dict = {m.csv_column: m.system_field for m in request.mappings}
-        required_fields = {m.system_field for m in request.mappings if m.required}
-
-        for header in request.csv_headers:
-            if header in mapping_dict:
-                mapped_fields[header] = mapping_dict[header]
-            else:
-                unmapped_columns.append(header)
-
-        mapped_system_fields = set(mapped_fields.values())
-        missing_required = list(required_fields - mapped_system_fields)
-
+        header_set = set(request.csv_headers)
+        mapping_dict = {}
+        required_fields = set()
         preview_mapping = {}
+        # Only a handful of distinct transforms exist, so the sample output is
+        # computed once per transform rather than once per mapping.
+        sample_transforms = {}
+
         for mapping in request.mappings:
-            if mapping.csv_column in request.csv_headers:
+            mapping_dict[mapping.csv_column] = mapping.system_field
+            if mapping.required:
+                required_fields.add(mapping.system_field)
+            if mapping.csv_column in header_set:
+                transform = mapping.transform
+                if transform not in sample_transforms:
+                    sample_transforms[transform] = self._apply_transform("Sample Value", transform)
                 preview_mapping[mapping.csv_column] = {
                     "maps_to": mapping.system_field,
                     "required": mapping.required,
-                    "transform": mapping.transform,
-                    "example_transform": self._apply_transform("Sample Value", mapping.transform)
+                    "transform": transform,
+                    "example_transform": sample_transforms[transform]
                 }
+
+        mapped_fields = {h: mapping_dict[h] for h in request.csv_headers if h in mapping_dict}
+        unmapped_columns = [h for h in request.csv_headers if h not in mapping_dict]
+        missing_required = list(required_fields.difference(mapped_fields.values()))
         
         return CSVMapFieldsResponse(
             mapped_fields=mapped_fields,
@@ -842,22 +1532,31 @@ class CampaignService:
         if not transform or not value:
             return value
         
-        if transform == "upper":
-            return value.upper()
-        elif transform == "lower":
-            return value.lower()
-        elif transform == "trim":
-            return value.strip()
-        elif transform == "title":
-            return value.title()
-        else:
-            return value
+        func = _TRANSFORMS.get(transform)
+        return func(value) if func is not None else value
 
     async def get_campaign_settings(self, campaign_id: str, company_id: str) -> Optional[CampaignSettings]:
-        async with await get_db_connection() as conn:
+        # Callers get their own copy, so mutating a returned settings object
+        # (e.g. the preferred_calling_hours dict) never leaks into the cache.
+        cached = _campaign_settings_cache.get((campaign_id, company_id))
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
+        settings = await self._fetch_campaign_settings(campaign_id, company_id)
+        if settings is not None:
+            _campaign_settings_cache.set((campaign_id, company_id), settings)
+            return settings.model_copy(deep=True)
+        return settings
+
+    async def _fetch_campaign_settings(self, campaign_id: str, company_id: str) -> Optional[CampaignSettings]:
+        # The fallback to the copies nested in automation_config is resolved
+        # in SQL, and the JSON pool hands back the four values as dicts.
+        async with await get_json_db_connection() as conn:
             row = await conn.fetchrow("""
-                SELECT booking_config, automation_config, 
-                       email_settings, call_settings, schedule_settings
+                SELECT COALESCE(booking_config::jsonb, '{}'::jsonb) AS booking,
+                       COALESCE(email_settings::jsonb, automation_config::jsonb -> 'email', '{}'::jsonb) AS email,
+                       COALESCE(call_settings::jsonb, automation_config::jsonb -> 'call', '{}'::jsonb) AS call,
+                       COALESCE(schedule_settings::jsonb, automation_config::jsonb -> 'schedule', '{}'::jsonb) AS schedule
                 FROM Campaign 
                 WHERE id = $1 AND company_id = $2
             """, campaign_id, company_id)
@@ -865,48 +1564,52 @@ class CampaignService:
         if not row:
             return None
 
-        booking_data = json.loads(row['booking_config']) if row['booking_config'] else {}
-
-        automation_data = json.loads(row['automation_config']) if row['automation_config'] else {}
-        email_data = json.loads(row['email_settings']) if row.get('email_settings') else automation_data.get('email', {})
-        call_data = json.loads(row['call_settings']) if row.get('call_settings') else automation_data.get('call', {})
-        schedule_data = json.loads(row['schedule_settings']) if row.get('schedule_settings') else automation_data.get('schedule', {})
-
-        booking_settings = BookingSettings(**self._apply_booking_defaults(booking_data))
-        email_settings = EmailSettings(**self._apply_email_defaults(email_data))
-        call_settings = CallSettings(**self._apply_call_defaults(call_data))
-        schedule_settings = ScheduleSettings(**self._apply_schedule_defaults(schedule_data))
+        # Validated here, once per cache miss, so legacy or hand-edited JSON is
+        # coerced (or rejected) instead of passed through; the wrapper only
+        # holds the already validated sub-models.
+        booking_settings = BookingSettings(**self._apply_booking_defaults(row['booking']))
+        email_settings = EmailSettings(**self._apply_email_defaults(row['email']))
+        call_settings = CallSettings(**self._apply_call_defaults(row['call']))
+        schedule_settings = ScheduleSettings(**self._apply_schedule_defaults(row['schedule']))
         
-        return CampaignSettings(
+        return CampaignSettings.model_construct(
             booking=booking_settings,
             email=email_settings,
             call=call_settings,
             schedule=schedule_settings
         )
     
+    async def _patch_settings(
+        self,
+        campaign_id: str,
+        company_id: str,
+        column: str,
+        patch: str
+    ) -> Optional[Dict[str, Any]]:
+        # The JSON pool takes the pre-serialised patch as is and hands the
+        # merged column back already decoded.
+        async with await get_json_db_connection() as conn:
+            stored = await conn.fetchval(
+                _SETTINGS_PATCH_SQL[column], patch, campaign_id, company_id
+            )
+        if stored is None:
+            return None
+        self._invalidate_campaign_cache(campaign_id, company_id)
+        return stored
+
     async def update_booking_settings(
         self, 
         campaign_id: str, 
         company_id: str, 
         settings: BookingSettingsUpdate
     ) -> Optional[BookingSettings]:
-
-        current = await self.get_campaign_settings(campaign_id, company_id)
-        if not current:
+        data = await self._patch_settings(
+            campaign_id, company_id, 'booking_config',
+            settings.model_dump_json(exclude_unset=True)
+        )
+        if data is None:
             return None
-
-        updated_data = current.booking.dict()
-        updates = settings.dict(exclude_unset=True)
-        updated_data.update(updates)
-
-        async with await get_db_connection() as conn:
-            await conn.execute("""
-                UPDATE Campaign 
-                SET booking_config = $1, updated_at = CURRENT_TIMESTAMP
-                WHERE id = $2 AND company_id = $3
-            """, json.dumps(updated_data), campaign_id, company_id)
-        
-        return BookingSettings(**updated_data)
+        return BookingSettings(**self._apply_booking_defaults(data))
     
     async def update_email_settings(
         self, 
@@ -914,23 +1617,13 @@ class CampaignService:
         company_id: str, 
         settings: EmailSettingsUpdate
     ) -> Optional[EmailSettings]:
-
-        current = await self.get_campaign_settings(campaign_id, company_id)
-        if not current:
+        data = await self._patch_settings(
+            campaign_id, company_id, 'email_settings',
+            settings.model_dump_json(exclude_unset=True)
+        )
+        if data is None:
             return None
-        
-        updated_data = current.email.dict()
-        updates = settings.dict(exclude_unset=True)
-        updated_data.update(updates)
-        
-        async with await get_db_connection() as conn:
-            await conn.execute("""
-                UPDATE Campaign 
-                SET email_settings = $1, updated_at = CURRENT_TIMESTAMP
-                WHERE id = $2 AND company_id = $3
-            """, json.dumps(updated_data), campaign_id, company_id)
-        
-        return EmailSettings(**updated_data)
+        return EmailSettings(**self._apply_email_defaults(data))
     
     async def update_call_settings(
         self, 
@@ -938,33 +1631,13 @@ class CampaignService:
         company_id: str, 
         settings: CallSettingsUpdate
     ) -> Optional[CallSettings]:
-
-        current = await self.get_campaign_settings(campaign_id, company_id)
-        if not current:
+        data = await self._patch_settings(
+            campaign_id, company_id, 'call_settings',
+            settings.model_dump_json(exclude_unset=True)
+        )
+        if data is None:
             return None
-        
-        updated_data = current.call.dict()
-        updates = settings.dict(exclude_unset=True)
-        updated_data.update(updates)
-        
-        async with await get_db_connection() as conn:
-            await conn.execute("""
-                UPDATE Campaign 
-                SET call_settings = $1, updated_at = CURRENT_TIMESTAMP
-                WHERE id = $2 AND company_id = $3
-            """, json.dumps(updated_data), campaign_id, company_id)
-        
-        return CallSettings(**updated_data)
-    
-    def _json_serialize(self, obj: Any) -> Any:
-        if isinstance(obj, dict):
-            return {k: self._json_serialize(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._json_serialize(i) for i in obj]
-        elif hasattr(obj, 'isoformat'):
-            return obj.isoformat()
-        else:
-            return obj
+        return CallSettings(**self._apply_call_defaults(data))
     
     async def update_schedule_settings(
         self, 
@@ -972,96 +1645,32 @@ class CampaignService:
         company_id: str, 
         settings: ScheduleSettingsUpdate
     ) -> Optional[ScheduleSettings]:
-        current = await self.get_campaign_settings(campaign_id, company_id)
-        if not current:
+        data = await self._patch_settings(
+            campaign_id, company_id, 'schedule_settings',
+            settings.model_dump_json(exclude_unset=True)
+        )
+        if data is None:
             return None
-
-        updated_data = self._json_serialize(current.schedule.dict())
-
-        updates = settings.dict(exclude_unset=True)
-        serialized_updates = self._json_serialize(updates)
-
-        updated_data.update(serialized_updates)
-        
-        async with await get_db_connection() as conn:
-            await conn.execute("""
-                UPDATE Campaign 
-                SET schedule_settings = $1, updated_at = CURRENT_TIMESTAMP
-                WHERE id = $2 AND company_id = $3
-            """, json.dumps(updated_data), campaign_id, company_id)
-        
-        return ScheduleSettings(**updated_data)
+        return ScheduleSettings(**self._apply_schedule_defaults(data))
     
     def _apply_booking_defaults(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        defaults = {
-            "calendar_type": "google",
-            "meeting_duration_minutes": 30,
-            "buffer_time_minutes": 15,
-            "send_invite_to_lead": True,
-            "send_invite_to_team": True,
-            "team_email_addresses": [],
-            "booking_window_days": 30,
-            "min_notice_hours": 2,
-            "max_bookings_per_day": None
-        }
-        defaults.update(data)
-        return defaults
+        return {**_BOOKING_DEFAULTS, "team_email_addresses": [], **data}
     
     def _apply_email_defaults(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        defaults = {
-            "template": "Hi {{first_name}}, let's connect!",
-            "subject_line": "Quick chat about your business needs",
-            "from_name": "Sales Team",
-            "from_email": "support@callsure.co.in",
-            "enable_followup": True,
-            "followup_delay_hours": 24,
-            "max_followup_attempts": 3,
-            "unsubscribe_link": True,
-            "track_opens": True,
-            "track_clicks": True
-        }
-        defaults.update(data)
-        return defaults
+        return {**_EMAIL_DEFAULTS, **data}
     
     def _apply_call_defaults(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        defaults = {
-            "script": "Hello {{first_name}}, this is {{agent_name}} calling about...",
-            "max_call_attempts": 3,
-            "call_interval_hours": 24,
-            "preferred_calling_hours": {
-                "start": "09:00",
-                "end": "17:00", 
-                "timezone": "UTC"
-            },
-            "voicemail_script": None,
-            "call_recording_enabled": True,
-            "auto_dial_enabled": False,
-            "caller_id": None
-        }
-        defaults.update(data)
-        return defaults
+        return {**_CALL_DEFAULTS, "preferred_calling_hours": dict(_PREFERRED_CALLING_HOURS), **data}
     
     def _apply_schedule_defaults(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        defaults = {
-            "working_days": ["monday", "tuesday", "wednesday", "thursday", "friday"],
-            "working_hours_start": "09:00:00",
-            "working_hours_end": "17:00:00",
-            "timezone": "UTC",
-            "lunch_break_start": "12:00:00",
-            "lunch_break_end": "13:00:00",
-            "max_concurrent_calls": 5,
-            "campaign_active_days": ["monday", "tuesday", "wednesday", "thursday", "friday"],
-            "pause_on_holidays": True
-        }
-        defaults.update(data)
-        return defaults
+        return {**_SCHEDULE_DEFAULTS, **data}
 
     async def get_callable_leads_count(self, campaign_id: str, filters: Dict[str, Any] = None) -> int:
         """Get count of leads that can be called"""
         async with (await get_db_connection()) as conn:
             query = """
                 SELECT COUNT(*) as count
-                FROM leads
+                FROM campaign_lead
                 WHERE campaign_id = $1 
                 AND status IN ('new', 'callback_requested', 'no_answer')
                 AND call_attempts < 3
@@ -1078,12 +1687,12 @@ class CampaignService:
             result = await conn.fetchrow(query, *params)
             return result["count"] if result else 0
 
-    async def get_callable_leads(self, campaign_id: str, filters: Dict[str, Any] = None) -> List[Dict]:
+    async def get_callable_leads(self, campaign_id: str, filters: Dict[str, Any] = None) -> List[Record]:
         """Get leads that can be called"""
         async with (await get_db_connection()) as conn:
             query = """
                 SELECT id, first_name, last_name, email, phone, company, status, call_attempts
-                FROM leads
+                FROM campaign_lead
                 WHERE campaign_id = $1 
                 AND status IN ('new', 'callback_requested', 'no_answer')
                 AND call_attempts < 3
@@ -1096,41 +1705,49 @@ class CampaignService:
                 query += f" LIMIT ${len(params) + 1}"
                 params.append(filters["limit"])
             
-            results = await conn.fetch(query, *params)
-            return [dict(row) for row in results]
+            return await conn.fetch(query, *params)
 
     async def get_calling_status(self, campaign_id: str, company_id: str) -> Optional[CallStatusResponse]:
         """Get current calling status for campaign"""
+        cached = _calling_status_cache.get((campaign_id, company_id))
+        if cached is not None:
+            return cached
+
+        status = await self._fetch_calling_status(campaign_id, company_id)
+        if status is not None:
+            _calling_status_cache.set((campaign_id, company_id), status)
+        return status
+
+    async def _fetch_calling_status(self, campaign_id: str, company_id: str) -> Optional[CallStatusResponse]:
         async with (await get_db_connection()) as conn:
-            # Check for active calling session
+            # Calling session and lead counts in one round-trip; the counts are
+            # prefixed so they cannot shadow campaign_call_status columns.
             status_query = """
-                SELECT * FROM campaign_call_status 
-                WHERE campaign_id = $1 AND company_id = $2
+                SELECT s.*, l.*
+                FROM campaign_call_status s
+                CROSS JOIN LATERAL (
+                    SELECT 
+                        COUNT(*) AS leads_total,
+                        COUNT(*) FILTER (WHERE call_attempts > 0) AS leads_called,
+                        COUNT(*) FILTER (WHERE status = 'completed') AS leads_successful,
+                        COUNT(*) FILTER (WHERE status = 'failed') AS leads_failed
+                    FROM campaign_lead
+                    WHERE campaign_id = $1
+                ) l
+                WHERE s.campaign_id = $1 AND s.company_id = $2
             """
             status_result = await conn.fetchrow(status_query, campaign_id, company_id)
             
             if not status_result:
                 return None
             
-            # Get lead counts
-            leads_query = """
-                SELECT 
-                    COUNT(*) as total_leads,
-                    COUNT(CASE WHEN call_attempts > 0 THEN 1 END) as called_leads,
-                    COUNT(CASE WHEN status = 'completed' THEN 1 END) as successful_calls,
-                    COUNT(CASE WHEN status = 'failed' THEN 1 END) as failed_calls
-                FROM leads
-                WHERE campaign_id = $1
-            """
-            leads_result = await conn.fetchrow(leads_query, campaign_id)
-            
             return CallStatusResponse(
                 campaign_id=campaign_id,
                 calling_active=status_result["status"] == "active",
-                total_leads=leads_result["total_leads"] if leads_result else 0,
-                called_leads=leads_result["called_leads"] if leads_result else 0,
-                successful_calls=leads_result["successful_calls"] if leads_result else 0,
-                failed_calls=leads_result["failed_calls"] if leads_result else 0,
+                total_leads=status_result["leads_total"],
+                called_leads=status_result["leads_called"],
+                successful_calls=status_result["leads_successful"],
+                failed_calls=status_result["leads_failed"],
                 active_calls=status_result.get("active_calls", 0),
                 queue_size=status_result.get("queue_size", 0),
                 estimated_completion=status_result.get("estimated_completion"),
@@ -1148,34 +1765,77 @@ class CampaignService:
                 ON CONFLICT (campaign_id, company_id)
                 DO UPDATE SET status = $3, updated_at = NOW()
             """, campaign_id, company_id, status)
+        _calling_status_cache.pop((campaign_id, company_id))
 
     async def update_calling_progress(self, campaign_id: str, **kwargs):
         """Update calling progress"""
-        async with (await get_db_connection()) as conn:
+        # Sorted, so keyword order does not produce a separate statement
+        fields = tuple(sorted(key for key in kwargs if key in _CALLING_PROGRESS_FIELDS))
+        if not fields:
+            return
+        mark_completed = bool(kwargs.get('completed'))
+        # A truthy `completed` becomes a literal SET, not a bound parameter
+        bound = [key for key in fields if not (key == 'completed' and mark_completed)]
+
+        query = _CALLING_PROGRESS_SQL_CACHE.get((fields, mark_completed))
+        if query is None:
             set_clauses = []
-            params = []
             param_idx = 1
-            
-            for key, value in kwargs.items():
-                if key in ['current_lead', 'total_leads', 'successful_calls', 'failed_calls', 'progress_percentage', 'completed']:
-                    if key == 'current_lead':
-                        set_clauses.append(f"current_lead_position = ${param_idx}")
-                    elif key == 'completed' and value:
-                        set_clauses.append(f"status = 'completed'")
-                        continue
-                    else:
-                        set_clauses.append(f"{key} = ${param_idx}")
-                    params.append(value)
-                    param_idx += 1
-            
-            if set_clauses:
-                query = f"""
-                    UPDATE campaign_call_status 
-                    SET {', '.join(set_clauses)}, updated_at = NOW()
-                    WHERE campaign_id = ${param_idx}
-                """
-                params.append(campaign_id)
-                await conn.execute(query, *params)
+            for key in fields:
+                if key == 'current_lead':
+                    set_clauses.append(f"current_lead_position = ${param_idx}")
+                elif key == 'completed' and mark_completed:
+                    set_clauses.append(f"status = 'completed'")
+                    continue
+                else:
+                    set_clauses.append(f"{key} = ${param_idx}")
+                param_idx += 1
+            query = _CALLING_PROGRESS_SQL_CACHE[(fields, mark_completed)] = f"""
+                UPDATE campaign_call_status 
+                SET {', '.join(set_clauses)}, updated_at = NOW()
+                WHERE campaign_id = ${param_idx}
+            """
+
+        params = [kwargs[key] for key in bound]
+        params.append(campaign_id)
+        async with (await get_db_connection()) as conn:
+            await conn.execute(query, *params)
+        _calling_status_cache.pop_where(lambda key: key[0] == campaign_id)
+
+    async def update_calling_progress_batch(self, updates: List[Dict[str, Any]]) -> int:
+        """
+        Update calling progress for several campaigns in one statement.
+        Each update needs campaign_id, current_lead, total_leads,
+        successful_calls, failed_calls and progress_percentage; use
+        update_calling_progress for partial updates.
+        """
+        if not updates:
+            return 0
+
+        async with (await get_db_connection()) as conn:
+            result = await conn.execute("""
+                UPDATE campaign_call_status s
+                SET current_lead_position = u.current_lead,
+                    total_leads = u.total_leads,
+                    successful_calls = u.successful_calls,
+                    failed_calls = u.failed_calls,
+                    progress_percentage = u.progress_percentage,
+                    updated_at = NOW()
+                FROM unnest($1::text[], $2::int[], $3::int[], $4::int[], $5::int[], $6::float8[])
+                    AS u(campaign_id, current_lead, total_leads, successful_calls, failed_calls, progress_percentage)
+                WHERE s.campaign_id = u.campaign_id
+            """,
+                [u['campaign_id'] for u in updates],
+                [u['current_lead'] for u in updates],
+                [u['total_leads'] for u in updates],
+                [u['successful_calls'] for u in updates],
+                [u['failed_calls'] for u in updates],
+                [u['progress_percentage'] for u in updates]
+            )
+
+        campaign_ids = {u['campaign_id'] for u in updates}
+        _calling_status_cache.pop_where(lambda key: key[0] in campaign_ids)
+        return int(result.split()[-1]) if result.startswith("UPDATE") else 0
 
     async def ensure_call_row_for_campaign(
         self,
@@ -1222,68 +1882,51 @@ class CampaignService:
             )
 
 
-    async def _initiate_lead_call(self, campaign_id: str, lead_id: str | None, to_number: str | None, call_sid: str | None, call_status: str | None):
+    async def _initiate_lead_calls(self, campaign_id: str, attempts: List[tuple]) -> int:
         """
-        Persist a call attempt for a lead in campaign_lead table.
+        Persist a batch of call attempts for leads in campaign_lead with one statement.
+        attempts: (lead_id, call_sid, call_status) tuples.
         Writes: call_attempts, last_call_at, status, last_call_sid, updated_at.
         """
+        if not attempts:
+            return 0
+
+        lead_ids, call_sids, statuses = zip(*attempts)
         try:
             async with await get_db_connection() as conn:
-                if lead_id:
-                    row = await conn.fetchrow(
-                        """
-                        UPDATE campaign_lead
-                        SET call_attempts = COALESCE(call_attempts, 0) + 1,
-                            last_call_at = NOW(),
-                            status = $3,
-                            last_call_sid = $4,
-                            updated_at = NOW()
-                        WHERE id = $1 AND campaign_id = $2
-                        RETURNING id, campaign_id, phone, call_attempts, last_call_at, status, last_call_sid
-                        """,
-                        lead_id,
-                        campaign_id,
-                        call_status or 'no-answer',
-                        call_sid
-                    )
-                else:
-                    phone_norm = to_number.lstrip('+') if to_number else None
-                    row = await conn.fetchrow(
-                        """
-                        UPDATE campaign_lead
-                        SET call_attempts = COALESCE(call_attempts, 0) + 1,
-                            last_call_at = NOW(),
-                            status = $3,
-                            last_call_sid = $4,
-                            updated_at = NOW()
-                        WHERE campaign_id = $1 AND (phone = $2 OR phone = $5)
-                        RETURNING id, campaign_id, phone, call_attempts, last_call_at, status, last_call_sid
-                        """,
-                        campaign_id,
-                        to_number,
-                        call_status or 'no-answer',
-                        call_sid,
-                        phone_norm
-                    )
+                result = await conn.execute(
+                    """
+                    UPDATE campaign_lead cl
+                    SET call_attempts = COALESCE(cl.call_attempts, 0) + 1,
+                        last_call_at = NOW(),
+                        status = a.status,
+                        last_call_sid = a.call_sid,
+                        updated_at = NOW()
+                    FROM unnest($2::text[], $3::text[], $4::text[]) AS a(lead_id, call_sid, status)
+                    WHERE cl.id = a.lead_id AND cl.campaign_id = $1
+                    """,
+                    campaign_id,
+                    list(lead_ids),
+                    list(call_sids),
+                    [status or 'no-answer' for status in statuses]
+                )
 
-                if row:
-                    rd = dict(row)
-                    logger.info("[activate] Persisted call attempt for lead %s phone=%s attempts=%s status=%s sid=%s",
-                                rd.get("id"), rd.get("phone"), rd.get("call_attempts"), rd.get("status"), rd.get("last_call_sid"))
-                    return rd
-                else:
-                    logger.warning("[activate] _initiate_lead_call: no matching campaign_lead row found for lead_id=%s phone=%s", lead_id, to_number)
-                    return None
+            updated = int(result.split()[-1]) if result.startswith("UPDATE") else 0
+            logger.info("[activate] Persisted %s call attempts for campaign %s", updated, campaign_id)
+            if updated < len(attempts):
+                logger.warning("[activate] _initiate_lead_calls: %s of %s leads not found in campaign_lead for campaign %s",
+                               len(attempts) - updated, len(attempts), campaign_id)
+            return updated
 
         except Exception as e:
-            logger.exception("[activate] Error persisting call attempt for lead_id=%s phone=%s: %s", lead_id, to_number, e)
+            logger.exception("[activate] Error persisting call attempts for campaign %s: %s", campaign_id, e)
             raise
 
     async def get_leads_count(self, campaign_id: str) -> int:
         """Get total leads count for campaign"""
         async with (await get_db_connection()) as conn:
             result = await conn.fetchrow(
-                "SELECT COUNT(*) as count FROM leads WHERE campaign_id = $1", 
+                "SELECT COUNT(*) as count FROM campaign_lead WHERE campaign_id = $1", 
                 campaign_id
             )
             return result["count"] if result else 0
@@ -1292,157 +1935,127 @@ class CampaignService:
         """Get called leads count for campaign"""
         async with (await get_db_connection()) as conn:
             result = await conn.fetchrow(
-                "SELECT COUNT(*) as count FROM leads WHERE campaign_id = $1 AND call_attempts > 0", 
+                "SELECT COUNT(*) as count FROM campaign_lead WHERE campaign_id = $1 AND call_attempts > 0", 
                 campaign_id
             )
             return result["count"] if result else 0
 
-    async def get_or_create_lead(self, lead_data: Dict[str, Any], company_id: str) -> Dict[str, Any]:
-        """Get existing lead or create new one in master leads table"""
-        
-        email = lead_data.get('email', '').strip().lower()
-        if not email:
-            raise ValueError("Email is required for lead creation")
-        
-        async with await get_db_connection() as conn:
-            # Check if lead exists for this company
-            existing_lead = await conn.fetchrow("""
-                SELECT * FROM leads 
-                WHERE company_id = $1 AND LOWER(email) = $2
-            """, uuid.UUID(company_id), email)
-            
-            if existing_lead:
-                # Update existing lead with new data if provided
-                update_fields = []
-                update_values = []
-                param_count = 1
-                
-                for field in ['first_name', 'last_name', 'phone', 'lead_company']:
-                    if lead_data.get(field) and not existing_lead[field]:
-                        update_fields.append(f"{field} = ${param_count}")
-                        update_values.append(lead_data[field])
-                        param_count += 1
-                
-                if update_fields:
-                    update_fields.append("updated_at = CURRENT_TIMESTAMP")
-                    update_values.extend([uuid.UUID(company_id), email])
-                    
-                    query = f"""
-                        UPDATE leads 
-                        SET {', '.join(update_fields)}
-                        WHERE company_id = ${param_count} AND LOWER(email) = ${param_count + 1}
-                        RETURNING *
-                    """
-                    result = await conn.fetchrow(query, *update_values)
-                    return dict(result)
-                
-                return dict(existing_lead)
-            
-            else:
-                # Create new lead
-                lead_id = uuid.uuid4()
-                now = datetime.utcnow()
-                
-                result = await conn.fetchrow("""
-                    INSERT INTO leads (
-                        id, company_id, email, first_name, last_name, 
-                        phone, lead_company, custom_fields, source, 
-                        created_at, updated_at
-                    ) VALUES (
-                        $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11
-                    ) RETURNING *
-                """,
-                    lead_id,
-                    uuid.UUID(company_id),
-                    email,
-                    lead_data.get('first_name'),
-                    lead_data.get('last_name'),
-                    lead_data.get('phone'),
-                    lead_data.get('company'),  # Maps to lead_company column
-                    json.dumps(lead_data.get('custom_fields', {})),
-                    lead_data.get('source', 'csv_import'),
-                    now,
-                    now
-                )
-                
-                return dict(result)
-    
-    async def add_lead_to_campaign(self, lead_id: str, campaign_id: str, lead_data: Dict[str, Any] = None) -> None:
-        """Add a lead to a campaign (create association)"""
-        
-        async with await get_db_connection() as conn:
-            # Check if association already exists
-            existing = await conn.fetchrow("""
-                SELECT id FROM campaign_leads 
-                WHERE campaign_id = $1 AND lead_id = $2
-            """, campaign_id, uuid.UUID(lead_id) if isinstance(lead_id, str) else lead_id)
-            
-            if not existing:
-                await conn.execute("""
-                    INSERT INTO campaign_leads (
-                        campaign_id, lead_id, campaign_status, 
-                        campaign_custom_fields, added_to_campaign_at
-                    ) VALUES (
-                        $1, $2, $3, $4, $5
-                    )
-                """,
-                    campaign_id,
-                    uuid.UUID(lead_id) if isinstance(lead_id, str) else lead_id,
-                    'pending',
-                    json.dumps(lead_data.get('custom_fields', {})) if lead_data else '{}',
-                    datetime.utcnow()
-                )
-    
+    async def get_lead_counts(self, campaign_id: str) -> Tuple[int, int]:
+        """Get (total, called) leads counts for campaign in one scan"""
+        cached = _lead_counts_cache.get(campaign_id)
+        if cached is not None:
+            return cached
+
+        async with (await get_db_connection()) as conn:
+            result = await conn.fetchrow("""
+                SELECT COUNT(*) AS total,
+                       COUNT(*) FILTER (WHERE call_attempts > 0) AS called
+                FROM campaign_lead
+                WHERE campaign_id = $1
+            """, campaign_id)
+        counts = (result["total"], result["called"])
+        _lead_counts_cache.set(campaign_id, counts)
+        return counts
+
     async def import_leads_csv_v2(self, campaign_id: str, csv_content: str, user_id: str, company_id: str) -> Dict[str, Any]:
         """Import leads using new lead management system"""
         
-        reader = csv.DictReader(io.StringIO(csv_content))
+        reader = csv.reader(io.StringIO(csv_content))
+        header = next(reader, [])
+        width = len(header)
+        # Columns resolved to positions once; rows are indexed directly
+        # instead of being turned into a dict each.
+        column_index = {name: i for i, name in enumerate(header)}
+        email_i, first_name_i, last_name_i, phone_i, company_i = (
+            column_index.get(field) for field in ('email', 'first_name', 'last_name', 'phone', 'company')
+        )
+        extra_columns = [(name, i) for name, i in column_index.items() if name not in _STANDARD_LEAD_FIELDS]
         
         imported = 0
         updated = 0
         failed = 0
         errors = []
-        
-        async with await get_db_connection() as conn:
-            async with conn.transaction():
-                for row_num, row in enumerate(reader, start=2):
-                    try:
-                        # Prepare lead data
-                        lead_data = {
-                            'email': row.get('email', '').strip(),
-                            'first_name': row.get('first_name', '').strip(),
-                            'last_name': row.get('last_name', '').strip(),
-                            'phone': row.get('phone', '').strip(),
-                            'company': row.get('company', '').strip(),
-                            'source': 'csv_import',
-                            'custom_fields': {}
-                        }
-                        
-                        # Add any extra fields to custom_fields
-                        standard_fields = {'email', 'first_name', 'last_name', 'phone', 'company'}
-                        for field, value in row.items():
-                            if field not in standard_fields and value:
-                                lead_data['custom_fields'][field] = value
-                        
-                        # Get or create lead in master table
-                        lead = await self.get_or_create_lead(lead_data, company_id)
-                        
-                        if lead.get('created_at') == lead.get('updated_at'):
-                            imported += 1
-                        else:
-                            updated += 1
-                        
-                        # Add to campaign
-                        await self.add_lead_to_campaign(lead['id'], campaign_id, lead_data)
-                        
-                    except Exception as e:
-                        failed += 1
-                        errors.append({
-                            'row': row_num,
-                            'error': str(e),
-                            'data': row
-                        })
-                        logger.error(f"Error importing row {row_num}: {e}")
+        # One timestamp for the whole import rather than a clock read per row
+        now = datetime.utcnow()
+
+        def valid_rows():
+            """(row_num, email, first, last, phone, company, custom_fields) per valid row"""
+            nonlocal failed
+            for row_num, row in enumerate((r for r in reader if r), start=2):
+                if len(row) < width:
+                    row.extend([''] * (width - len(row)))
+                email = row[email_i].strip().lower() if email_i is not None else ''
+                if not email:
+                    failed += 1
+                    errors.append({
+                        'row': row_num,
+                        'error': "Email is required for lead creation",
+                        'data': dict(zip(header, row))
+                    })
+                    logger.error(f"Error importing row {row_num}: Email is required for lead creation")
+                    continue
+                yield (
+                    row_num,
+                    email,
+                    row[first_name_i].strip() if first_name_i is not None else '',
+                    row[last_name_i].strip() if last_name_i is not None else '',
+                    row[phone_i].strip() if phone_i is not None else '',
+                    row[company_i].strip() if company_i is not None else '',
+                    # Add any extra fields to custom_fields
+                    _dumps({name: row[i] for name, i in extra_columns if row[i]}),
+                )
+
+        # Rows are validated here and then written with a few set-based
+        # statements per page of LEAD_IMPORT_PAGE_SIZE rows, instead of a
+        # lead lookup/insert/link per row. Each page commits on
+        # its own, so a database error only fails the rows of that page.
+        company_uuid = uuid.UUID(company_id)
+        pending = valid_rows()
+        while page := list(islice(pending, LEAD_IMPORT_PAGE_SIZE)):
+            (row_nums, emails, first_names, last_names,
+             phones, companies, custom_fields) = map(list, zip(*page))
+            try:
+                async with await get_db_connection() as conn:
+                    async with conn.transaction():
+                        await conn.execute(
+                            _IMPORT_FILL_LEADS_SQL, company_uuid,
+                            emails, first_names, last_names, phones, [None] * len(emails),
+                            timeout=LEAD_COPY_TIMEOUT
+                        )
+                        await conn.execute(
+                            _IMPORT_V2_INSERT_LEADS_SQL, company_uuid,
+                            emails, first_names, last_names, phones, companies,
+                            custom_fields, now,
+                            timeout=LEAD_COPY_TIMEOUT
+                        )
+                        await conn.execute(
+                            _IMPORT_V2_LINK_LEADS_SQL, campaign_id, company_uuid,
+                            emails, custom_fields, now,
+                            timeout=LEAD_COPY_TIMEOUT
+                        )
+                        # Leads never modified after creation count as imported
+                        rows = await conn.fetch("""
+                            SELECT LOWER(email) AS email, created_at = updated_at AS is_new
+                            FROM leads
+                            WHERE company_id = $1 AND LOWER(email) = ANY($2::text[])
+                        """, company_uuid, emails, timeout=LEAD_COPY_TIMEOUT)
+            except Exception as e:
+                failed += len(emails)
+                errors.append({
+                    'row': row_nums[0],
+                    'rows': [row_nums[0], row_nums[-1]],
+                    'error': f"Rows {row_nums[0]}-{row_nums[-1]} failed: {e}",
+                    'data': None
+                })
+                logger.error(f"Error importing rows {row_nums[0]}-{row_nums[-1]}: {e}")
+                continue
+
+            is_new = {r['email']: r['is_new'] for r in rows}
+            for email in emails:
+                if is_new.get(email):
+                    imported += 1
+                else:
+                    updated += 1
         
         return {
             'imported': imported,
@@ -1462,7 +2075,8 @@ class CampaignService:
                 rows = await conn.fetch(
                     """
                     SELECT id, campaign_id, first_name, last_name, email, phone, company,
-                           custom_fields, call_attempts, last_call_at, status, created_at, updated_at, country_code
+                           custom_fields, call_attempts, last_call_at, status, created_at, updated_at, country_code,
+                           to_number
                     FROM campaign_lead
                     WHERE campaign_id = $1 AND status = $2
                     ORDER BY created_at ASC
@@ -1476,7 +2090,7 @@ class CampaignService:
             raise
 
     async def log_campaign_status_change(self, campaign_id: str, status: str, user_id: str = None, prev_status: str = None):
-        activity_id = f"ACT-{uuid.uuid4().hex[:8].upper()}"
+        activity_id = f"ACT-{os.urandom(4).hex().upper()}"
         now = datetime.utcnow()
         try:
             async with await get_db_connection() as conn:
@@ -1556,27 +2170,38 @@ class CampaignService:
             logger.error(f"Error marking campaign lead call (campaign={campaign_id}, lead_id={lead_id}, phone={phone}): {e}")
             raise
  
-    async def get_campaign_leads_v2(self, campaign_id: str, offset: int = 0, limit: int = 100) -> List[Dict]:
-        """Get leads for a campaign using new structure"""
+    async def get_campaign_leads_v2(
+        self,
+        campaign_id: str,
+        offset: int = 0,
+        limit: int = 100,
+        before: Optional[Tuple[datetime, uuid.UUID]] = None
+    ) -> List[Record]:
+        """
+        Get leads for a campaign using new structure, most recently added
+        first. Pass the (added_to_campaign_at, id) of the last lead of a page
+        as `before` to get the next page by index seek instead of OFFSET;
+        `offset` is ignored when `before` is given.
+        """
         
         async with await get_db_connection() as conn:
-            rows = await conn.fetch("""
-                SELECT 
-                    l.*,
-                    cl.campaign_status,
-                    cl.call_attempts,
-                    cl.last_call_at,
-                    cl.email_attempts,
-                    cl.campaign_custom_fields,
-                    cl.added_to_campaign_at
-                FROM campaign_leads cl
-                JOIN leads l ON l.id = cl.lead_id
-                WHERE cl.campaign_id = $1
-                ORDER BY cl.added_to_campaign_at DESC
-                OFFSET $2 LIMIT $3
-            """, campaign_id, offset, limit)
+            if before is not None:
+                rows = await conn.fetch(f"""
+                    {_CAMPAIGN_LEADS_V2_SELECT}
+                    WHERE cl.campaign_id = $1
+                    AND (cl.added_to_campaign_at, cl.lead_id) < ($2, $3)
+                    ORDER BY cl.added_to_campaign_at DESC, cl.lead_id DESC
+                    LIMIT $4
+                """, campaign_id, *before, limit)
+            else:
+                rows = await conn.fetch(f"""
+                    {_CAMPAIGN_LEADS_V2_SELECT}
+                    WHERE cl.campaign_id = $1
+                    ORDER BY cl.added_to_campaign_at DESC, cl.lead_id DESC
+                    OFFSET $2 LIMIT $3
+                """, campaign_id, offset, limit)
             
-            return [dict(row) for row in rows]
+            return rows
     
     async def update_campaign_lead_status(self, campaign_id: str, lead_id: str, status: str) -> bool:
         """Update lead status within a campaign"""
@@ -1590,12 +2215,114 @@ class CampaignService:
             
             return result.startswith("UPDATE 1")
 
+    async def enqueue_campaign_dials(
+        self,
+        campaign_id: str,
+        company_id: str,
+        lead_ids: List[str],
+        max_call_attempts: int
+    ) -> int:
+        """Queue leads in campaign_dial_queue so the dial worker picks them up"""
+        if not lead_ids:
+            return 0
+
+        async with await get_db_connection() as conn:
+            result = await conn.execute("""
+                INSERT INTO campaign_dial_queue (
+                    campaign_id, company_id, lead_id, attempts_left, next_attempt_at
+                )
+                SELECT $1, $2, lead_id, $4, NOW()
+                FROM unnest($3::text[]) AS lead_id
+                ON CONFLICT (campaign_id, lead_id) DO NOTHING
+            """, campaign_id, company_id, lead_ids, max_call_attempts)
+
+        return int(result.split()[-1]) if result.startswith("INSERT") else 0
+
+    async def claim_due_dials(self, batch_size: int, lock_seconds: int) -> List[Dict]:
+        """
+        Lock up to batch_size due queue rows for this worker and return them
+        joined with the lead fields needed to dial. SKIP LOCKED lets several
+        workers drain the queue concurrently without double-dialing.
+        """
+        async with await get_db_connection() as conn:
+            rows = await conn.fetch("""
+                WITH claimed AS (
+                    UPDATE campaign_dial_queue
+                    SET locked_until = NOW() + make_interval(secs => $2)
+                    WHERE id IN (
+                        SELECT id FROM campaign_dial_queue
+                        WHERE next_attempt_at <= NOW()
+                          AND (locked_until IS NULL OR locked_until < NOW())
+                        ORDER BY next_attempt_at
+                        LIMIT $1
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    RETURNING id, campaign_id, company_id, lead_id, attempts_left, last_call_sid, locked_until
+                )
+                SELECT c.*, cl.phone, cl.country_code, cl.to_number, cl.first_name
+                FROM claimed c
+                LEFT JOIN campaign_lead cl ON cl.id = c.lead_id
+            """, batch_size, lock_seconds)
+        return [dict(r) for r in rows]
+
+    async def renew_dial_lock(self, queue_id: int, locked_until: datetime, lock_seconds: int) -> Optional[datetime]:
+        """
+        Push a claimed row's lock forward right before it is dialed. The
+        locked_until returned by claim_due_dials (or a previous renewal) acts
+        as the claim token: if the lock lapsed and another worker re-claimed
+        the row, nothing is updated and None is returned so the row is left
+        to that worker.
+        """
+        async with await get_db_connection() as conn:
+            return await conn.fetchval("""
+                UPDATE campaign_dial_queue
+                SET locked_until = NOW() + make_interval(secs => $3)
+                WHERE id = $1 AND locked_until = $2
+                RETURNING locked_until
+            """, queue_id, locked_until, lock_seconds)
+
+    async def reschedule_dial(self, queue_id: int, call_sid: str | None, interval_minutes: float) -> None:
+        """Consume one attempt and release the queue row until the next check is due"""
+        async with await get_db_connection() as conn:
+            await conn.execute("""
+                UPDATE campaign_dial_queue
+                SET attempts_left = attempts_left - 1,
+                    last_call_sid = $2,
+                    next_attempt_at = NOW() + make_interval(secs => $3),
+                    locked_until = NULL
+                WHERE id = $1
+            """, queue_id, call_sid, interval_minutes * 60)
+
+    async def defer_dials(self, queue_ids: List[int], delay_seconds: float) -> None:
+        """Release queue rows for another try later without consuming an attempt"""
+        async with await get_db_connection() as conn:
+            await conn.execute("""
+                UPDATE campaign_dial_queue
+                SET next_attempt_at = NOW() + make_interval(secs => $2),
+                    locked_until = NULL
+                WHERE id = ANY($1::bigint[])
+            """, queue_ids, delay_seconds)
+
+    async def complete_dial(self, queue_id: int) -> None:
+        """Remove a lead from the dial queue once it's answered or out of attempts"""
+        async with await get_db_connection() as conn:
+            await conn.execute("DELETE FROM campaign_dial_queue WHERE id = $1", queue_id)
+
+    async def get_call_status_by_sid(self, call_sid: str) -> str:
+        """Current Call table status for a call_sid; a missing row counts as no-answer"""
+        async with await get_db_connection() as conn:
+            call_row = await conn.fetchrow('SELECT status FROM "Call" WHERE call_sid = $1', call_sid)
+        if not call_row:
+            logger.warning("[activate] No row in Call table for call_sid=%s; treating as no-answer for retry decision", call_sid)
+            return "no-answer"
+        return (call_row.get("status") or "").lower()
+
 
     # ADD THESE METHODS TO CampaignService class
 
     async def get_slot_configuration(self, campaign_id: str, company_id: str) -> Optional[Dict]:
         """Get slot configuration for a campaign"""
-        async with await get_db_connection() as conn:
+        async with await get_json_db_connection() as conn:
             row = await conn.fetchrow("""
                 SELECT * FROM campaign_slot_configuration
                 WHERE campaign_id = $1 AND company_id = $2
@@ -1623,16 +2350,8 @@ class CampaignService:
                     "allow_multiple_bookings_per_customer": False
                 }
             
-            # Parse JSONB fields
-            config = dict(row)
-            if config.get('business_hours'):
-                config['business_hours'] = json.loads(config['business_hours'])
-            if config.get('predefined_slots'):
-                config['predefined_slots'] = json.loads(config['predefined_slots'])
-            if config.get('closer_shifts'):
-                config['closer_shifts'] = json.loads(config['closer_shifts'])
-            
-            return config
+            # JSONB fields are already decoded by the connection's codec
+            return dict(row)
 
     async def get_agent_from_number(self, agent_id: str) -> tuple:
         """Get agent phone number and service provider"""
@@ -1678,9 +2397,9 @@ class CampaignService:
     ) -> Dict:
         """Create or update slot configuration"""
         
-        config_id = f"SLOT-{uuid.uuid4().hex[:8].upper()}"
+        config_id = f"SLOT-{os.urandom(4).hex().upper()}"
         
-        async with await get_db_connection() as conn:
+        async with await get_json_db_connection() as conn:
             # Check if config exists
             existing = await conn.fetchrow("""
                 SELECT id FROM campaign_slot_configuration
@@ -1688,9 +2407,9 @@ class CampaignService:
             """, campaign_id)
             
             # Prepare JSONB fields
-            business_hours_json = json.dumps(config.get('business_hours', {}))
-            predefined_slots_json = json.dumps(config.get('predefined_slots', []))
-            closer_shifts_json = json.dumps(config.get('closer_shifts', []))
+            business_hours_json = _dumps(config.get('business_hours', {}))
+            predefined_slots_json = _dumps(config.get('predefined_slots', []))
+            closer_shifts_json = _dumps(config.get('closer_shifts', []))
             
             if existing:
                 # Update
@@ -1750,13 +2469,8 @@ class CampaignService:
                     config.get('allow_multiple_bookings_per_customer', False)
                 )
             
-            result = dict(row)
-            # Parse JSONB fields for response
-            result['business_hours'] = json.loads(result['business_hours'])
-            result['predefined_slots'] = json.loads(result['predefined_slots'])
-            result['closer_shifts'] = json.loads(result['closer_shifts'])
-            
-            return result
+            # JSONB fields are already decoded by the connection's codec
+            return dict(row)
 
 
 # ============================================
@@ -1823,7 +2537,126 @@ async def _make_outbound_call_request(
     return None, None, last_error
 
 
+async def _build_dial_context(svc: "CampaignService", campaign_id: str, company_id: str) -> dict | None:
+    """
+    Resolve everything a dial needs that is shared by all leads of a campaign:
+    agent number/provider, processor URL, static payload fields and the
+    per-campaign concurrency limit. Returns None only if the campaign no longer
+    exists; failures that may be transient (database errors, agent number
+    lookup) raise so the caller can retry later.
+    """
+    campaign = await svc.get_campaign(campaign_id, company_id)
+    if not campaign:
+        # get_campaign also returns None when the query fails, so confirm the
+        # campaign is really gone before callers drop its leads.
+        if await svc.campaign_exists(campaign_id, company_id):
+            raise RuntimeError(f"Campaign {campaign_id} could not be loaded")
+        logger.error(f"[activate] Campaign not found: {campaign_id}")
+        return None
+
+    agent_id = getattr(campaign, "agent_id", None)
+
+    # Read the few scalars we need straight off the model instead of dumping
+    # the whole AutomationSettings tree to a dict.
+    automation = getattr(campaign, "automation", None)
+
+    try:
+        from_number, provider = await svc.get_agent_from_number(agent_id)
+        logger.info("[activate] Agent phone: %s, provider: %s", from_number, provider)
+    except Exception as e:
+        logger.error("[activate] Failed to get agent number for %s: %s", agent_id, e)
+        raise
+
+    # Everything except the per-lead fields is identical across dials, so
+    # build it once and only merge to_number/customer_name per attempt.
+    return {
+        "campaign_id": campaign_id,
+        "company_id": company_id,
+        "from_number": from_number,
+        "call_url": f"https://processor.callsure.ai/api/v1/calls/outbound?provider={provider}",
+        "payload_template": {
+            "from_number": from_number,
+            "company_id": company_id,
+            "agent_id": agent_id,
+            "campaign_id": campaign_id,
+            "call_script": getattr(automation, "call_script", None) or ""
+        },
+        "max_call_attempts": int(getattr(automation, "max_call_attempts", 3)),
+        "call_interval_minutes": float(getattr(automation, "call_interval_minutes", 5)),
+        "max_concurrent_calls": int(getattr(automation, "max_concurrent_calls", 5)),
+        # (lead_id, call_sid, status) per attempt, flushed in bulk by the caller
+        # through CampaignService._initiate_lead_calls.
+        "lead_call_writes": [],
+    }
+
+
+async def _dial_lead_once(svc: "CampaignService", lead: dict, ctx: dict) -> dict:
+    """
+    Initiates a single outbound call attempt and returns:
+    {"success": bool, "call_sid": str|None, "processor_status": str|None, "to_number": str, "lead_id": str}
+    """
+    campaign_id = ctx["campaign_id"]
+    company_id = ctx["company_id"]
+    lead_id = lead.get("id")
+
+    # to_number is normalised once at CSV import; leads imported before the
+    # column existed are normalised here instead.
+    to_number = lead.get("to_number") or _normalize_to_number(lead.get("phone"), lead.get("country_code"))
+    if not to_number:
+        logger.warning("[activate] Skipping lead %s - no phone", lead_id)
+        return {"success": False, "call_sid": None, "processor_status": None, "to_number": None, "lead_id": lead_id}
+
+    logger.info(f"[activate] Dialing lead {lead_id} -> {to_number}")
+
+    customer_name = (lead.get("first_name") or "").strip()
+    payload = {**ctx["payload_template"], "to_number": to_number, "customer_name": customer_name}
+
+    # Use the retry helper function
+    resp, json_data, error = await _make_outbound_call_request(
+        url=ctx["call_url"],
+        payload=payload
+    )
+
+    if error:
+        # All retries failed
+        logger.error("[activate] Call initiation failed for lead %s to %s after retries: %s",
+                    lead_id, to_number, error)
+        ctx["lead_call_writes"].append((lead_id, None, 'failed'))
+        return {"success": False, "call_sid": None, "processor_status": "failed", "to_number": to_number, "lead_id": lead_id}
+
+    if resp is None:
+        return {"success": False, "call_sid": None, "processor_status": None, "to_number": to_number, "lead_id": lead_id}
+
+    processor_status = json_data.get("status") or (json_data.get("success") and "queued") or None
+    call_sid = json_data.get("call_sid")
+
+    if call_sid:
+        await svc.ensure_call_row_for_campaign(
+            call_sid=call_sid,
+            campaign_id=campaign_id,
+            company_id=company_id,
+            to_number=to_number,
+            from_number=ctx["from_number"],
+        )
+
+    if resp.status_code in (200, 201, 202) and (processor_status or call_sid):
+        ctx["lead_call_writes"].append((lead_id, call_sid, processor_status))
+
+        logger.info("[activate] Call initiated for lead %s -> %s (campaign %s) sid=%s status=%s",
+                   lead_id, to_number, campaign_id, call_sid, processor_status)
+        return {"success": True, "call_sid": call_sid, "processor_status": processor_status, "to_number": to_number, "lead_id": lead_id}
+    else:
+        logger.warning("[activate] Call API returned %s for %s: %s", resp.status_code, to_number, resp.text)
+        ctx["lead_call_writes"].append((lead_id, call_sid, processor_status or 'no-answer'))
+        return {"success": False, "call_sid": call_sid, "processor_status": processor_status, "to_number": to_number, "lead_id": lead_id}
+
+
 async def _process_campaign_on_activate(campaign_id: str, company_id: str, user_id: str):
+    """
+    Queue every pending lead of the campaign in campaign_dial_queue. The
+    actual dialing and retry scheduling is done by the campaign dial worker,
+    so no per-lead task is held in memory for the duration of the retries.
+    """
     svc = CampaignService()
     try:
         campaign = await svc.get_campaign(campaign_id, company_id)
@@ -1831,199 +2664,21 @@ async def _process_campaign_on_activate(campaign_id: str, company_id: str, user_
             logger.error(f"[activate] Campaign not found: {campaign_id}")
             return
 
-        agent_id = getattr(campaign, "agent_id", None) or (campaign.agent_id if hasattr(campaign, "agent_id") else None)
-
-        automation_model = getattr(campaign, "automation", None)
-
-        if automation_model is None:
-            automation = {}
-        else:
-            try:
-                automation = automation_model.dict()
-            except Exception:
-                automation = dict(automation_model) if isinstance(automation_model, dict) else {}
-
-        max_call_attempts = int(automation.get("max_call_attempts", 3))
-        call_interval_minutes = float(automation.get("call_interval_minutes", 5))
-        max_concurrent_calls = int(automation.get("max_concurrent_calls", 5))
-        delay_between_calls = float(automation.get("delay_between_calls", 2))
-        call_script = automation.get("call_script", "")
-        enable_followup = bool(automation.get("enable_followup_emails", False))
+        max_call_attempts = int(getattr(campaign.automation, "max_call_attempts", 3))
 
         leads = await svc.get_campaign_leads(campaign_id, status="pending")
         if not leads:
             logger.info(f"[activate] No pending leads found for campaign {campaign_id}")
             return
 
-        sem = asyncio.Semaphore(max_concurrent_calls)
-
-        async def dial_once_and_get_sid(lead: dict, svc: CampaignService) -> dict:
-            """
-            Initiates a single outbound call attempt and returns:
-            {"success": bool, "call_sid": str|None, "processor_status": str|None, "to_number": str, "lead_id": str}
-            """
-            lead_id = lead.get("id")
-            try:
-                from_number, provider = await svc.get_agent_from_number(agent_id)
-                logger.info("[activate] Agent phone: %s, provider: %s", from_number, provider)
-            except Exception as e:
-                logger.error("[activate] Failed to get agent number for %s: %s", agent_id, e)
-                return {"success": False, "call_sid": None, "processor_status": None, "to_number": None, "lead_id": lead_id}
-            
-            phone_raw = (lead.get("phone") or "").strip()
-            country_code_raw = str(lead.get("country_code") or "").strip()
-            if not phone_raw:
-                logger.warning("[activate] Skipping lead %s - no phone", lead_id)
-                return {"success": False, "call_sid": None, "processor_status": None, "to_number": None, "lead_id": lead_id}
-
-            phone_digits = re.sub(r'\D', '', phone_raw)
-            cc_digits = re.sub(r'\D', '', country_code_raw)
-            if phone_digits.startswith("0") and cc_digits:
-                phone_digits = phone_digits.lstrip("0")
-
-            if cc_digits:
-                to_number = f"+{cc_digits}{phone_digits}"
-            else:
-                to_number = f"+{phone_digits}" if not phone_raw.startswith("+") else phone_raw
-
-            logger.info(f"[activate] Dialing lead {lead_id} -> {to_number}")
-            
-            customer_name = (lead.get("first_name") or "").strip()
-            payload = {
-                "from_number": from_number,
-                "to_number": to_number,
-                "company_id": company_id,
-                "agent_id": agent_id,
-                "customer_name": customer_name,
-                "campaign_id": campaign_id,
-                "call_script": call_script
-            }
-
-            async with sem:
-                # Use the retry helper function
-                resp, json_data, error = await _make_outbound_call_request(
-                    url=f"https://processor.callsure.ai/api/v1/calls/outbound?provider={provider}",
-                    payload=payload
-                )
-                
-                if error:
-                    # All retries failed
-                    logger.error("[activate] Call initiation failed for lead %s to %s after retries: %s", 
-                                lead_id, to_number, error)
-                    try:
-                        await svc._initiate_lead_call(
-                            campaign_id=campaign_id, 
-                            lead_id=lead_id, 
-                            to_number=to_number, 
-                            call_sid=None, 
-                            call_status='failed'
-                        )
-                    except Exception:
-                        pass
-                    return {"success": False, "call_sid": None, "processor_status": "failed", "to_number": to_number, "lead_id": lead_id}
-                
-                if resp is None:
-                    return {"success": False, "call_sid": None, "processor_status": None, "to_number": to_number, "lead_id": lead_id}
-
-                processor_status = json_data.get("status") or (json_data.get("success") and "queued") or None
-                call_sid = json_data.get("call_sid")
-                
-                if call_sid:
-                    await svc.ensure_call_row_for_campaign(
-                        call_sid=call_sid,
-                        campaign_id=campaign_id,
-                        company_id=company_id,
-                        to_number=to_number,
-                        from_number=from_number,
-                    )
-
-                if resp.status_code in (200, 201, 202) and (processor_status or call_sid):
-                    try:
-                        await svc._initiate_lead_call(
-                            campaign_id=campaign_id, 
-                            lead_id=lead_id, 
-                            to_number=to_number, 
-                            call_sid=call_sid, 
-                            call_status=processor_status
-                        )
-                    except Exception as e:
-                        logger.warning("[activate] _initiate_lead_call failed (initial): %s", e)
-                    
-                    logger.info("[activate] Call initiated for lead %s -> %s (campaign %s) sid=%s status=%s", 
-                               lead_id, to_number, campaign_id, call_sid, processor_status)
-                    return {"success": True, "call_sid": call_sid, "processor_status": processor_status, "to_number": to_number, "lead_id": lead_id}
-                else:
-                    logger.warning("[activate] Call API returned %s for %s: %s", resp.status_code, to_number, resp.text)
-                    try:
-                        await svc._initiate_lead_call(
-                            campaign_id=campaign_id, 
-                            lead_id=lead_id, 
-                            to_number=to_number, 
-                            call_sid=call_sid, 
-                            call_status=processor_status or 'no-answer'
-                        )
-                    except Exception:
-                        pass
-                    return {"success": False, "call_sid": call_sid, "processor_status": processor_status, "to_number": to_number, "lead_id": lead_id}
-
-        async def process_with_retries(lead: dict):
-            lead_id = lead.get("id")
-            attempts = 0
-            remaining_attempts = max_call_attempts
-
-            last_call_sid = None
-            last_to_number = None
-            last_processor_status = None
-
-            while remaining_attempts > 0:
-                attempts += 1
-                remaining_attempts -= 1
-
-                res = await dial_once_and_get_sid(lead, svc)
-                last_call_sid = res.get("call_sid")
-                last_to_number = res.get("to_number")
-                last_processor_status = res.get("processor_status")
-
-                if not last_call_sid:
-                    logger.warning("[activate] No call_sid for lead %s attempt %s; remaining=%s", lead_id, attempts, remaining_attempts)
-                    if remaining_attempts <= 0:
-                        logger.info("[activate] Exhausted attempts for lead %s without call_sid", lead_id)
-                        break
-                    await asyncio.sleep(call_interval_minutes * 60)
-                    continue
-
-                logger.info("[activate] Waiting %s minute(s) to check Call table for call_sid=%s (lead=%s)", call_interval_minutes, last_call_sid, lead_id)
-                await asyncio.sleep(call_interval_minutes * 60)
-
-                try:
-                    async with await get_db_connection() as conn:
-                        call_row = await conn.fetchrow('SELECT status FROM "Call" WHERE call_sid = $1', last_call_sid)
-                        if call_row:
-                            call_table_status = (call_row.get("status") or "").lower()
-                        else:
-                            logger.warning("[activate] No row in Call table for call_sid=%s; treating as no-answer for retry decision", last_call_sid)
-                            call_table_status = "no-answer"
-                except Exception as e:
-                    logger.exception("[activate] Error querying Call table for call_sid=%s: %s", last_call_sid, e)
-                    call_table_status = "no-answer"
-
-                logger.info("[activate] Call table status for sid=%s -> %s (lead=%s)", last_call_sid, call_table_status, lead_id)
-
-                if call_table_status == "no-answer":
-                    if remaining_attempts <= 0:
-                        logger.info("[activate] No remaining attempts for lead %s; stop retrying", lead_id)
-                        break
-                    logger.info("[activate] Retrying lead %s (attempts so far=%s)", lead_id, attempts)
-                    continue
-                else:
-                    logger.info("[activate] Terminal/answered status for lead %s: %s — no retry", lead_id, call_table_status)
-                    break
-
-        tasks = [asyncio.create_task(process_with_retries(ld)) for ld in leads]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        queued = await svc.enqueue_campaign_dials(
+            campaign_id,
+            company_id,
+            [ld["id"] for ld in leads],
+            max_call_attempts
+        )
 
-        logger.info(f"[activate] Completed dialing for campaign {campaign_id}: "
-            f"{len(leads)} leads processed, check individual call statuses above")
+        logger.info(f"[activate] Queued {queued} of {len(leads)} pending leads for campaign {campaign_id}")
 
     except Exception as e:
-        logger.exception(f"[activate] Unhandled exception for campaign {campaign_id}: {e}")
\ No newline at end of file
+        logger.exception(f"[activate] Unhandled exception for campaign {campaign_id}: {e}")
@@ -0,0 +1,35 @@
+from datetime import timedelta
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+import asyncpg
+import orjson
+from fastapi.responses import Response
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, asyncpg.Record):
+        return dict(obj)
+    if isinstance(obj, Decimal):
+        # Same conversion as fastapi's jsonable_encoder
+        return int(obj) if obj.as_tuple().exponent >= 0 else float(obj)
+    if isinstance(obj, UUID):
+        # asyncpg returns uuid columns as its own UUID subclass, which orjson
+        # does not serialise natively
+        return str(obj)
+    if isinstance(obj, timedelta):
+        return obj.total_seconds()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class RecordsJSONResponse(Response):
+    """
+    JSON response for raw asyncpg rows. Records are serialised directly by
+    orjson, skipping the dict copy per row and the jsonable_encoder pass that
+    returning them from a route would cost.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default)
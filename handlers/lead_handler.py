@@ -619,13 +619,12 @@ class LeadHandler:
                     distributed += len(lead_ids)
                     
                     # Record assignment events
-                    for lead_id in lead_ids:
-                        await self._record_lead_event(
-                            conn,
-                            lead_id,
-                            'assigned',
-                            {'agent_id': agent_id, 'method': request.distribution_method}
-                        )
+                    await self._record_lead_events(
+                        conn,
+                        lead_ids,
+                        'assigned',
+                        {'agent_id': agent_id, 'method': request.distribution_method}
+                    )
         
         return LeadDistributionResponse(
             distributed=distributed,
@@ -745,6 +744,19 @@ class LeadHandler:
             datetime.utcnow()
         )
 
+    async def _record_lead_events(self, conn, lead_ids: List[str], event_type: str,
+                                  event_data: Dict[str, Any]):
+        """Record the same event for many leads in one pipelined executemany"""
+        payload = json.dumps(event_data)
+        now = datetime.utcnow()
+        await conn.executemany(
+            self.queries.record_lead_event(),
+            [
+                (f"EVT-{str(uuid.uuid4())[:8].upper()}", lead_id, event_type, payload, now)
+                for lead_id in lead_ids
+            ]
+        )
+
     async def bulk_update_leads(self, request: BulkLeadUpdate) -> Dict[str, Any]:
         """Bulk update multiple leads with the same updates"""
         if not request.lead_ids:
@@ -795,16 +807,15 @@ class LeadHandler:
                 results = await conn.fetch(query, *values)
                 
                 # Record bulk update events for each lead
-                for lead in results:
-                    await self._record_lead_event(
-                        conn,
-                        lead['id'],
-                        'bulk_updated',
-                        {
-                            'fields_updated': list(request.updates.keys()),
-                            'updated_values': request.updates
-                        }
-                    )
+                await self._record_lead_events(
+                    conn,
+                    [lead['id'] for lead in results],
+                    'bulk_updated',
+                    {
+                        'fields_updated': list(request.updates.keys()),
+                        'updated_values': request.updates
+                    }
+                )
                 
                 updated_count = len(results)
                 
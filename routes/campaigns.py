@@ -22,7 +22,8 @@ from app.models.schemas import (
 
 from app.models.campaigns import CreateCampaignRequest, CampaignResponse, UpdateCampaignRequest
 from middleware.auth_middleware import get_current_user
-from app.services.campaign_service import CampaignService, _process_campaign_on_activate
+from app.services.campaign_service import CampaignService, LEAD_EXPORT_COLUMNS, _process_campaign_on_activate
+from app.utils.json_response import RecordsJSONResponse
 from app.services.websocket_service import manager, WebSocketService
 from handlers.s3_handler import S3Handler
 import io, csv
@@ -36,6 +37,7 @@ from app.db.postgres_client import get_db_connection
 from enum import Enum
 from pydantic import BaseModel
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/campaigns", tags=["Campaigns"])
@@ -119,6 +121,15 @@ async def _activate_ai_agents(
         except Exception as e:
             log.error("Could not create default agent for campaign %s: %s", campaign_id, e)
 
+async def _upload_csv_lines(upload: UploadFile) -> io.TextIOWrapper:
+    """
+    Decode the spooled upload lazily as CSV lines instead of reading it into
+    one bytes object and one str. Call detach() when done so the upload's own
+    file is left for UploadFile to close.
+    """
+    await upload.seek(0)
+    return io.TextIOWrapper(upload.file, encoding="utf-8", newline="")
+
 @router.post("/create", response_model=CampaignResponse)
 async def create_campaign(
     background_tasks: BackgroundTasks,
@@ -150,14 +161,11 @@ async def create_campaign(
         
         s3_url = upload_result["url"]
 
-        csv_text = (await leads_csv.read()).decode("utf-8")
-        await leads_csv.seek(0)
-        import json
         try:
-            mapping_obj = json.loads(data_mapping)
-            booking_obj = json.loads(booking_config)
-            automation_obj = json.loads(automation_config)
-        except json.JSONDecodeError as e:
+            mapping_obj = orjson.loads(data_mapping)
+            booking_obj = orjson.loads(booking_config)
+            automation_obj = orjson.loads(automation_config)
+        except orjson.JSONDecodeError as e:
             raise HTTPException(400, f"Bad JSON: {e}")
 
         req = CreateCampaignRequest(
@@ -170,14 +178,18 @@ async def create_campaign(
         )
 
         service = CampaignService()
-        campaign = await service.create_campaign(
-            campaign_request=req,
-            company_id=company_id,
-            created_by=current_user.id,
-            csv_content=csv_text,
-            s3_url=s3_url,
-            agent_id=agent_id,
-        )
+        csv_lines = await _upload_csv_lines(leads_csv)
+        try:
+            campaign = await service.create_campaign(
+                campaign_request=req,
+                company_id=company_id,
+                created_by=current_user.id,
+                csv_content=csv_lines,
+                s3_url=s3_url,
+                agent_id=agent_id,
+            )
+        finally:
+            csv_lines.detach()
 
         background_tasks.add_task(
             setup_campaign_automation,
@@ -216,6 +228,8 @@ async def get_company_campaigns(
     company_id: str,
     limit: int = 50,
     offset: int = 0,
+    before_created_at: Optional[datetime] = None,
+    before_id: Optional[str] = None,
     current_user: UserResponse = Depends(get_current_user),
 ):
 
@@ -224,7 +238,8 @@ async def get_company_campaigns(
         campaigns = await campaign_service.get_campaigns_by_company(
             company_id=company_id,
             limit=limit,
-            offset=offset
+            offset=offset,
+            before=(before_created_at, before_id) if before_created_at and before_id else None
         )
         
         return campaigns
@@ -233,6 +248,27 @@ async def get_company_campaigns(
         logger.error(f"Error fetching campaigns: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to fetch campaigns")
 
+@router.get("/company/{company_id}/stream")
+async def stream_company_campaigns(
+    company_id: str,
+    current_user: UserResponse = Depends(get_current_user),
+    company_handler: CompanyHandler = Depends(CompanyHandler),
+):
+    """All campaigns of a company as newline-delimited JSON, streamed row by row"""
+    company = await company_handler.get_company_by_user(current_user.id)
+    if not company:
+        raise HTTPException(400, "User does not belong to any company")
+    if str(company["id"]) != company_id:
+        raise HTTPException(403, "You don't have access to this company's campaigns")
+
+    campaign_service = CampaignService()
+
+    async def ndjson_lines():
+        async for campaign in campaign_service.iter_campaigns_by_company(company_id):
+            yield campaign.model_dump_json() + "\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
 @router.get("/{campaign_id}", response_model=CampaignResponse)
 async def get_campaign(
     campaign_id: str,
@@ -488,7 +524,7 @@ async def list_agents(
 ):
     comp_id = (await ch.get_company_by_user(current.id))["id"]
     await _ensure_campaign(campaign_id, comp_id)
-    return await svc.get_agents(campaign_id)
+    return RecordsJSONResponse(await svc.get_agents(campaign_id))
 
 @router.post("/{campaign_id}/agents/assign", status_code=201)
 async def assign_agents(
@@ -549,9 +585,8 @@ async def campaign_metrics_websocket(
 
     try:
         while True:
-            bookings = await svc.get_bookings(campaign_id)
-            calls = await svc.get_campaign_calls_via_agents(campaign_id)
-            metrics = await svc.get_campaign_metrics_summary(campaign_id)
+            dashboard = await svc.get_campaign_dashboard(campaign_id)
+            metrics = dashboard["metrics"]
             payload = {
                 "type": "campaign_metrics",
                 "campaign_id": campaign_id,
@@ -564,8 +599,8 @@ async def campaign_metrics_websocket(
                     "conversion_rate": f'{metrics["conversion_rate"]}%',
                     "avg_call_duration": f'{metrics["avg_call_duration_seconds"]}s'
                 },
-                "bookings": bookings,
-                "calls": calls
+                "bookings": dashboard["bookings"],
+                "calls": dashboard["calls"]
             }
 
             await websocket.send_json(jsonable_encoder(payload))
@@ -591,9 +626,8 @@ async def get_campaign_metrics(
     if not campaign:
         raise HTTPException(404, "Campaign not found")
 
-    bookings = await svc.get_bookings(campaign_id)
-    calls = await svc.get_campaign_calls_via_agents(campaign_id)
-    metrics = await svc.get_campaign_metrics_summary(campaign_id)
+    dashboard = await svc.get_campaign_dashboard(campaign_id)
+    metrics = dashboard["metrics"]
 
     return {
         "metrics": {
@@ -605,8 +639,8 @@ async def get_campaign_metrics(
             "conversion_rate": f'{metrics["conversion_rate"]}%',
             "avg_call_duration": f'{metrics["avg_call_duration_seconds"]}s'
         },
-        "bookings": bookings,
-        "calls": calls
+        "bookings": dashboard["bookings"],
+        "calls": dashboard["calls"]
     }
 
 
@@ -619,7 +653,7 @@ async def metrics_history(
     ch: CompanyHandler    = Depends(CompanyHandler),
 ):
     await _check_owner(campaign_id, current, ch)
-    return await svc.get_metrics_history(campaign_id, days_back=days)
+    return RecordsJSONResponse(await svc.get_metrics_history(campaign_id, days_back=days))
 
 @router.get("/{campaign_id}/call-logs")
 async def call_logs(
@@ -629,7 +663,7 @@ async def call_logs(
     ch: CompanyHandler    = Depends(CompanyHandler),
 ):
     await _check_owner(campaign_id, current, ch)
-    return await svc.get_call_logs(campaign_id, limit)
+    return RecordsJSONResponse(await svc.get_call_logs(campaign_id, limit))
 
 @router.get("/{campaign_id}/bookings")
 async def campaign_bookings(
@@ -638,14 +672,14 @@ async def campaign_bookings(
     ch: CompanyHandler    = Depends(CompanyHandler),
 ):
     await _check_owner(campaign_id, current, ch)
-    return await svc.get_bookings(campaign_id)
+    return RecordsJSONResponse(await svc.get_bookings(campaign_id))
 
 @router.get("/analytics/summary")
 async def analytics_summary(
     current: UserResponse = Depends(get_current_user),
     ch: CompanyHandler    = Depends(CompanyHandler),
 ):
-    return await svc.get_overall_summary()
+    return RecordsJSONResponse(await svc.get_overall_summary())
 
 async def _ensure_campaign_access(campaign_id: str, user: UserResponse, ch: CompanyHandler):
     comp = await ch.get_company_by_user(user.id)
@@ -663,33 +697,55 @@ async def upload_leads_csv(
     current_user: UserResponse = Depends(get_current_user),
     company_handler: CompanyHandler = Depends(CompanyHandler),
 ):
-    await _ensure_campaign_access(campaign_id, current_user, company_handler)
+    company_id = await _ensure_campaign_access(campaign_id, current_user, company_handler)
     
     if not leads_csv.filename.lower().endswith('.csv'):
         raise HTTPException(400, "File must be a CSV")
     
-    content = await leads_csv.read()
-    content_str = content.decode('utf-8')
-    
-    svc = CampaignService()
-    count = await svc.import_leads_csv(campaign_id, content_str, current_user.id)
+    csv_lines = await _upload_csv_lines(leads_csv)
+    try:
+        svc = CampaignService()
+        count = await svc.import_leads_csv(campaign_id, csv_lines, current_user.id, company_id)
+    finally:
+        csv_lines.detach()
     
     return {"message": f"Successfully imported {count} leads"}
 
+@router.get("/{campaign_id}/detail")
+async def get_campaign_detail(
+    campaign_id: str,
+    leads_limit: int = Query(100, ge=1, le=1000),
+    current_user: UserResponse = Depends(get_current_user),
+    company_handler: CompanyHandler = Depends(CompanyHandler),
+):
+    comp = await company_handler.get_company_by_user(current_user.id)
+    if not comp:
+        raise HTTPException(400, "User has no company")
+
+    svc = CampaignService()
+    detail = await svc.get_campaign_detail(campaign_id, comp["id"], leads_limit)
+    if not detail:
+        raise HTTPException(404, "Campaign not found")
+
+    return detail
+
 @router.get("/{campaign_id}/leads")
 async def get_leads(
     campaign_id: str,
     offset: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    before_created_at: Optional[datetime] = Query(None),
+    before_id: Optional[str] = Query(None),
     current_user: UserResponse = Depends(get_current_user),
     company_handler: CompanyHandler = Depends(CompanyHandler),
 ):
     await _ensure_campaign_access(campaign_id, current_user, company_handler)
     
     svc = CampaignService()
-    leads = await svc.get_leads(campaign_id, offset, limit)
+    before = (before_created_at, before_id) if before_created_at and before_id else None
+    leads = await svc.get_leads(campaign_id, offset, limit, before)
     
-    return leads
+    return RecordsJSONResponse(leads)
 
 @router.post("/{campaign_id}/leads", status_code=201)
 async def add_lead(
@@ -766,14 +822,8 @@ async def export_leads(
     output = io.StringIO()
     writer = csv.writer(output)
 
-    writer.writerow(['id', 'first_name', 'last_name', 'email', 'phone', 'company', 'status', 'call_attempts'])
-
-    for lead in leads:
-        writer.writerow([
-            lead.get('id'), lead.get('first_name'), lead.get('last_name'),
-            lead.get('email'), lead.get('phone'), lead.get('company'),
-            lead.get('status'), lead.get('call_attempts', 0)
-        ])
+    writer.writerow(LEAD_EXPORT_COLUMNS)
+    writer.writerows(leads)
     
     output.seek(0)
     
@@ -1111,11 +1161,12 @@ async def get_calling_status(
         
         if not status:
             # Return default status if no active calling
+            total_leads, called_leads = await svc.get_lead_counts(campaign_id)
             return CallStatusResponse(
                 campaign_id=campaign_id,
                 calling_active=False,
-                total_leads=await svc.get_leads_count(campaign_id),
-                called_leads=await svc.get_called_leads_count(campaign_id),
+                total_leads=total_leads,
+                called_leads=called_leads,
                 successful_calls=0,
                 failed_calls=0,
                 active_calls=0,
@@ -1153,7 +1204,7 @@ async def _process_ai_calls(
         successful_calls = 0
         failed_calls = 0
         
-        for i, lead in enumerate(leads):
+        for lead in leads:
             try:
                 # Check if calling should continue (campaign might be paused/stopped)
                 campaign = await svc.get_campaign(campaign_id, company_id)
@@ -1161,16 +1212,6 @@ async def _process_ai_calls(
                     logger.info(f"Stopping calls for campaign {campaign_id}, status: {campaign.status}")
                     break
                 
-                # Update progress
-                await svc.update_calling_progress(
-                    campaign_id, 
-                    current_lead=i + 1,
-                    total_leads=total_leads,
-                    successful_calls=successful_calls,
-                    failed_calls=failed_calls,
-                    progress_percentage=((i + 1) / total_leads) * 100
-                )
-                
                 # Initiate call for lead
                 call_result = await svc.initiate_lead_call(
                     campaign_id=campaign_id,
@@ -1195,17 +1236,17 @@ async def _process_ai_calls(
                 logger.error(f"Error calling lead {lead.get('id', 'unknown')}: {e}")
                 continue
         
-        # Update final status
+        # Update final status. Progress is written once here rather than
+        # with a round-trip per lead; set_calling_status marks it completed.
         await svc.set_calling_status(campaign_id, company_id, "completed")
-        await svc.update_calling_progress(
-            campaign_id,
-            current_lead=total_leads,
-            total_leads=total_leads,
-            successful_calls=successful_calls,
-            failed_calls=failed_calls,
-            completed=True,
-            progress_percentage=100.0
-        )
+        await svc.update_calling_progress_batch([{
+            "campaign_id": campaign_id,
+            "current_lead": total_leads,
+            "total_leads": total_leads,
+            "successful_calls": successful_calls,
+            "failed_calls": failed_calls,
+            "progress_percentage": 100.0,
+        }])
         
         logger.info(f"AI calling completed for campaign {campaign_id}: {successful_calls}/{total_leads} successful")
         
@@ -0,0 +1,50 @@
+import sys
+import os
+
+# Get the path of the project root and add it to the system path.
+# This ensures that modules like 'app' can be imported correctly.
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+import asyncio
+from app.db.postgres_client import get_db_connection
+
+# CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so each
+# statement is executed on its own.
+KEYSET_INDEXES = [
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_campaign_lead_campaign_created
+        ON campaign_lead(campaign_id, created_at DESC, id DESC)
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_campaign_company_created
+        ON campaign(company_id, created_at DESC, id DESC)
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_campaign_leads_campaign_added
+        ON campaign_leads(campaign_id, added_to_campaign_at DESC, lead_id DESC)
+    """,
+]
+
+
+async def add_campaign_keyset_indexes():
+    """
+    Adds the indexes backing keyset pagination of campaign leads, of a
+    company's campaigns (ORDER BY created_at DESC, id DESC) and of the
+    campaign_leads association (ORDER BY added_to_campaign_at DESC), built
+    without locking the tables against writes.
+    This script is idempotent.
+    """
+    try:
+        async with await get_db_connection() as conn:
+            for statement in KEYSET_INDEXES:
+                await conn.execute(statement, timeout=None)
+            print("Successfully created campaign keyset pagination indexes.")
+    except Exception as e:
+        print(f"Error creating campaign keyset pagination indexes: {e}")
+
+
+if __name__ == "__main__":
+    # Ensure this is run from the project root with `python scripts/add_campaign_keyset_indexes.py`
+    asyncio.run(add_campaign_keyset_indexes())
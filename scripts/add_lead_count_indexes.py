@@ -0,0 +1,53 @@
+import sys
+import os
+
+# Get the path of the project root and add it to the system path.
+# This ensures that modules like 'app' can be imported correctly.
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+import asyncio
+from app.db.postgres_client import get_db_connection
+
+# CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so each
+# statement is executed on its own.
+LEAD_COUNT_INDEXES = [
+    # Total and called lead counts per campaign (get_lead_counts and the
+    # calling status) as index-only scans over the campaign's own lead rows
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_campaign_lead_campaign_call_attempts
+        ON campaign_lead(campaign_id, call_attempts)
+    """,
+    # Callable leads (get_callable_leads and its count); the predicate must
+    # be implied by their WHERE clause for the planner to use it, so it only
+    # holds the fixed status/phone conditions. The attempts limit varies per
+    # caller and is checked against the included call_attempts, which keeps
+    # the count index-only; created_at order serves the listing without a sort.
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_campaign_lead_callable_created
+        ON campaign_lead(campaign_id, created_at) INCLUDE (call_attempts)
+        WHERE status IN ('new', 'callback_requested', 'no_answer')
+          AND phone IS NOT NULL
+    """,
+]
+
+
+async def add_lead_count_indexes():
+    """
+    Adds the indexes backing the per-campaign lead counts shown by the calling
+    endpoints, built without locking campaign_lead against writes.
+    This script is idempotent.
+    """
+    try:
+        async with await get_db_connection() as conn:
+            for statement in LEAD_COUNT_INDEXES:
+                await conn.execute(statement, timeout=None)
+            print("Successfully created lead count indexes.")
+    except Exception as e:
+        print(f"Error creating lead count indexes: {e}")
+
+
+if __name__ == "__main__":
+    # Ensure this is run from the project root with `python scripts/add_lead_count_indexes.py`
+    asyncio.run(add_lead_count_indexes())
@@ -0,0 +1,40 @@
+import sys
+import os
+
+# Get the path of the project root and add it to the system path.
+# This ensures that modules like 'app' can be imported correctly.
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+import asyncio
+from app.db.postgres_client import get_db_connection
+
+# Lead lookups in the CSV imports match on
+# LOWER(email), which the UNIQUE(company_id, email) index cannot serve.
+# Not unique: other writers store emails as given, so existing data may hold
+# case variants of the same address.
+LOWER_EMAIL_INDEX = """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_company_lower_email
+        ON leads(company_id, LOWER(email))
+"""
+
+
+async def add_leads_lower_email_index():
+    """
+    Adds the expression index backing case-insensitive lead lookups by email,
+    built without locking the leads table against writes.
+    This script is idempotent.
+    """
+    try:
+        async with await get_db_connection() as conn:
+            # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+            await conn.execute(LOWER_EMAIL_INDEX, timeout=None)
+            print("Successfully created leads lower(email) index.")
+    except Exception as e:
+        print(f"Error creating leads lower(email) index: {e}")
+
+
+if __name__ == "__main__":
+    # Ensure this is run from the project root with `python scripts/add_leads_lower_email_index.py`
+    asyncio.run(add_leads_lower_email_index())
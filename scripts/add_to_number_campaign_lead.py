@@ -0,0 +1,34 @@
+import sys
+import os
+
+# Get the path of the project root and add it to the system path.
+# This ensures that modules like 'app' can be imported correctly.
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+import asyncio
+from app.db.postgres_client import get_db_connection
+
+
+async def add_to_number_to_campaign_lead():
+    """
+    Updates the campaign_lead table schema to include the to_number column,
+    the dialable number normalised from phone/country_code at CSV import.
+    Existing rows are left NULL and normalised at dial time instead.
+    This script is idempotent.
+    """
+    try:
+        async with await get_db_connection() as conn:
+            await conn.execute("""
+                ALTER TABLE campaign_lead
+                ADD COLUMN IF NOT EXISTS to_number VARCHAR(50);
+            """)
+            print("Successfully added 'to_number' column to the 'campaign_lead' table.")
+    except Exception as e:
+        print(f"Error updating campaign_lead table schema: {e}")
+
+
+if __name__ == "__main__":
+    # Ensure this is run from the project root with `python scripts/add_to_number_campaign_lead.py`
+    asyncio.run(add_to_number_to_campaign_lead())
@@ -0,0 +1,59 @@
+import sys
+import os
+
+# Get the path of the project root and add it to the system path.
+# This ensures that modules like 'app' can be imported correctly.
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+import asyncio
+from app.db.postgres_client import get_db_connection
+
+CAMPAIGN_TABLES = [
+    "campaign",
+    "campaign_lead",
+    "campaign_leads",
+    "campaign_slot_configuration",
+]
+
+
+async def convert_campaign_jsonb_arrays():
+    """
+    Converts any JSONB[] (array-of-jsonb) column on the campaign tables into a
+    single JSONB column holding a JSON array. asyncpg has to split the Postgres
+    array literal before decoding every element of a JSONB[] value, whereas a
+    JSONB array is decoded in one pass.
+    This script is idempotent: columns that are already JSONB are left untouched.
+    """
+    try:
+        async with await get_db_connection() as conn:
+            columns = await conn.fetch("""
+                SELECT table_name, column_name
+                FROM information_schema.columns
+                WHERE table_schema = current_schema()
+                  AND table_name = ANY($1::text[])
+                  AND data_type = 'ARRAY'
+                  AND udt_name = '_jsonb'
+            """, CAMPAIGN_TABLES)
+
+            if not columns:
+                print("No JSONB[] columns found on campaign tables; nothing to convert.")
+                return
+
+            async with conn.transaction():
+                for col in columns:
+                    table, column = col["table_name"], col["column_name"]
+                    await conn.execute(f"""
+                        ALTER TABLE "{table}"
+                        ALTER COLUMN "{column}" TYPE JSONB
+                        USING to_jsonb("{column}");
+                    """)
+                    print(f"Converted '{table}.{column}' from JSONB[] to JSONB.")
+    except Exception as e:
+        print(f"Error converting campaign JSONB[] columns: {e}")
+
+
+if __name__ == "__main__":
+    # Ensure this is run from the project root with `python scripts/convert_campaign_jsonb_arrays.py`
+    asyncio.run(convert_campaign_jsonb_arrays())
@@ -0,0 +1,46 @@
+import sys
+import os
+
+# Get the path of the project root and add it to the system path.
+# This ensures that modules like 'app' can be imported correctly.
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+import asyncio
+from app.db.postgres_client import get_db_connection
+
+
+async def create_campaign_dial_queue_table():
+    """
+    Creates the campaign_dial_queue table drained by the campaign dial worker.
+    One row per lead being dialed; the row is deleted once the lead answers or
+    runs out of attempts. This script is idempotent.
+    """
+    try:
+        async with await get_db_connection() as conn:
+            await conn.execute("""
+                CREATE TABLE IF NOT EXISTS campaign_dial_queue (
+                    id BIGSERIAL PRIMARY KEY,
+                    campaign_id VARCHAR(255) NOT NULL REFERENCES Campaign(id) ON DELETE CASCADE,
+                    company_id VARCHAR(255) NOT NULL,
+                    lead_id VARCHAR(255) NOT NULL,
+                    attempts_left INTEGER NOT NULL,
+                    last_call_sid TEXT,
+                    next_attempt_at TIMESTAMP NOT NULL DEFAULT NOW(),
+                    locked_until TIMESTAMP,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE(campaign_id, lead_id)
+                );
+
+                CREATE INDEX IF NOT EXISTS idx_campaign_dial_queue_due
+                    ON campaign_dial_queue(next_attempt_at);
+            """)
+            print("Successfully created 'campaign_dial_queue' table.")
+    except Exception as e:
+        print(f"Error creating campaign_dial_queue table: {e}")
+
+
+if __name__ == "__main__":
+    # Ensure this is run from the project root with `python scripts/create_campaign_dial_queue_table.py`
+    asyncio.run(create_campaign_dial_queue_table())